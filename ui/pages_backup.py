@@ -8,15 +8,29 @@ import uuid
 from services.python_question_bank import question_bank
 import io
 import sys
+import functools
+import hashlib
+import operator
+import mmap
 import traceback
 from contextlib import redirect_stdout
 import psutil
 import os
+import shutil
+import tempfile
 import sqlite3
 import re
 import json
 import glob
 import numpy as np
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; JSON helpers fall back to the standard library
+    orjson = None
 
 # Helper function for safe date parsing with multiple formats
 def parse_date_with_formats(date_str, default_date=None):
@@ -51,6 +65,11 @@ def parse_date_with_formats(date_str, default_date=None):
     
     return default_date
 
+@functools.lru_cache(maxsize=4096)
+def parse_due_date(date_str):
+    """Cached parse_date_with_formats for quiz due dates; returns None if missing or unparseable."""
+    return parse_date_with_formats(date_str)
+
 # Python question generator function
 def generate_python_questions(topics, difficulty, num_questions, mc_count=None, coding_count=None):
     """Generate Python programming questions based on selected topics and difficulty."""
@@ -2570,6 +2589,9 @@ def render_quiz_page():
             except Exception as e:
                 st.error(f"Failed to save quiz results: {str(e)}")
             
+            # The new result must show up on the rankings page straight away
+            clear_ranking_caches()
+            
             # Go to results page
             st.session_state.page = "student_results"
             st.rerun()
@@ -3826,6 +3848,166 @@ def render_developer_home_page():
     else:
         st.info("No recent activity found")
 
+def dump_json_bytes(data):
+    """Return data as indented JSON bytes, encoded with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+def format_json(data):
+    """Return data as an indented JSON string, encoded with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2)
+
+def load_json_bytes(data):
+    """Parse JSON from bytes or a memoryview, decoded with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(bytes(data))
+
+# API endpoints shown on the developer API documentation tab
+ApiEndpoint = namedtuple("ApiEndpoint", "endpoint method description parameters response")
+
+API_ENDPOINTS = (
+    ApiEndpoint(
+        endpoint="/quizzes",
+        method="GET",
+        description="Get a list of all available quizzes",
+        parameters="status (optional): Filter by quiz status (active, draft, completed)",
+        response="""
+        ```json
+        {
+          "quizzes": [
+            {
+              "id": "123",
+              "title": "Python Basics Quiz",
+              "description": "Test your knowledge of Python fundamentals",
+              "status": "active",
+              "created_at": "2023-01-15T10:30:00Z"
+            },
+            ...
+          ]
+        }
+        ```
+        """
+    ),
+    ApiEndpoint(
+        endpoint="/quizzes/{quiz_id}",
+        method="GET",
+        description="Get details for a specific quiz",
+        parameters="quiz_id: The ID of the quiz to retrieve",
+        response="""
+        ```json
+        {
+          "id": "123",
+          "title": "Python Basics Quiz",
+          "description": "Test your knowledge of Python fundamentals",
+          "status": "active",
+          "questions": [
+            {
+              "id": "q1",
+              "text": "What is the output of print(1 + 2)?",
+              "type": "multiple_choice",
+              "options": ["1", "2", "3", "12"],
+              "correct_answer": "3"
+            },
+            ...
+          ],
+          "created_at": "2023-01-15T10:30:00Z"
+        }
+        ```
+        """
+    ),
+    ApiEndpoint(
+        endpoint="/users/{user_id}/results",
+        method="GET",
+        description="Get quiz results for a specific user",
+        parameters="user_id: The ID of the user",
+        response="""
+        ```json
+        {
+          "user_id": "456",
+          "results": [
+            {
+              "quiz_id": "123",
+              "quiz_title": "Python Basics Quiz",
+              "score": 85.5,
+              "completed_at": "2023-01-20T14:22:15Z"
+            },
+            ...
+          ]
+        }
+        ```
+        """
+    ),
+    ApiEndpoint(
+        endpoint="/analytics/performance",
+        method="GET",
+        description="Get performance analytics across all quizzes",
+        parameters="period (optional): Time period for analytics (day, week, month, year)",
+        response="""
+        ```json
+        {
+          "period": "month",
+          "average_score": 78.3,
+          "total_submissions": 156,
+          "completion_rate": 92.5,
+          "quiz_performance": [
+            {
+              "quiz_id": "123",
+              "quiz_title": "Python Basics Quiz",
+              "average_score": 82.1,
+              "submissions": 48
+            },
+            ...
+          ]
+        }
+        ```
+        """
+    ),
+)
+
+# Sample API keys (in a real application, these would come from a database)
+ApiKey = namedtuple("ApiKey", "id name key created last_used status")
+
+API_KEYS = (
+    ApiKey(id="1", name="Production Key", key="pk_live_4f8h3j9g2k5l7m6n9p0q", created="2023-01-10", last_used="2023-03-15", status="active"),
+    ApiKey(id="2", name="Development Key", key="pk_test_1a2b3c4d5e6f7g8h9i0j", created="2023-02-05", last_used="2023-03-14", status="active"),
+    ApiKey(id="3", name="Test Key", key="pk_test_7y6t5r4e3w2q1p0o9i8u", created="2023-02-20", last_used="2023-02-25", status="revoked"),
+)
+
+# Share of total traffic and average latency per endpoint for the usage statistics tab
+EndpointUsage = namedtuple("EndpointUsage", "endpoint share avg_response_time")
+
+TOP_ENDPOINT_USAGE = (
+    EndpointUsage("/quizzes", 0.35, 120),
+    EndpointUsage("/users/{id}/results", 0.25, 200),
+    EndpointUsage("/analytics/performance", 0.15, 350),
+    EndpointUsage("/quizzes/{id}", 0.15, 100),
+    EndpointUsage("/users", 0.10, 150),
+)
+
+# Character ranges of an ISO "YYYY-MM-DDTHH:MM" string that match the chart label formats
+ISO_MINUTE_SLICES = {
+    "%H:%M": (11, 16),
+    "%m/%d": (5, 10),
+}
+
+def format_datetimes(dates, date_format):
+    """Format datetimes for chart labels by slicing numpy ISO strings rather than calling strftime per value."""
+    if date_format not in ISO_MINUTE_SLICES:
+        return pd.Series(dates).dt.strftime(date_format).to_numpy()
+    
+    start, stop = ISO_MINUTE_SLICES[date_format]
+    iso = np.datetime_as_string(np.asarray(dates, dtype="datetime64[m]"), unit="m").astype("U16")
+    
+    # View each string as a row of characters, keep the wanted columns and view them back as strings
+    chars = np.ascontiguousarray(iso.view("U1").reshape(-1, 16)[:, start:stop])
+    if date_format == "%m/%d":
+        chars[:, 2] = "/"
+    return chars.view(f"U{stop - start}").ravel()
+
 def render_developer_api_page():
     """Render the developer API documentation and testing page."""
     import pandas as pd
@@ -3853,11 +4035,18 @@ def render_developer_api_page():
             st.session_state.page = "developer_home"
             st.rerun()
     
-    # API Documentation and Testing tabs
-    api_tabs = st.tabs(["API Documentation", "API Testing", "API Keys", "Usage Statistics"])
+    # API Documentation and Testing sections. A radio is used instead of st.tabs
+    # because tabs execute every body on each rerun; only the selected one runs here.
+    api_section = st.radio(
+        "API Section",
+        ["API Documentation", "API Testing", "API Keys", "Usage Statistics"],
+        horizontal=True,
+        label_visibility="collapsed",
+        key="api_section"
+    )
     
     # API Documentation Tab
-    with api_tabs[0]:
+    if api_section == "API Documentation":
         st.subheader("REST API Documentation")
         
         # API Overview
@@ -3885,117 +4074,20 @@ def render_developer_api_page():
         # API Endpoints
         st.markdown("### Endpoints")
         
-        # Define the API endpoints for documentation
-        api_endpoints = [
-            {
-                "endpoint": "/quizzes",
-                "method": "GET",
-                "description": "Get a list of all available quizzes",
-                "parameters": "status (optional): Filter by quiz status (active, draft, completed)",
-                "response": """
-                ```json
-                {
-                  "quizzes": [
-                    {
-                      "id": "123",
-                      "title": "Python Basics Quiz",
-                      "description": "Test your knowledge of Python fundamentals",
-                      "status": "active",
-                      "created_at": "2023-01-15T10:30:00Z"
-                    },
-                    ...
-                  ]
-                }
-                ```
-                """
-            },
-            {
-                "endpoint": "/quizzes/{quiz_id}",
-                "method": "GET",
-                "description": "Get details for a specific quiz",
-                "parameters": "quiz_id: The ID of the quiz to retrieve",
-                "response": """
-                ```json
-                {
-                  "id": "123",
-                  "title": "Python Basics Quiz",
-                  "description": "Test your knowledge of Python fundamentals",
-                  "status": "active",
-                  "questions": [
-                    {
-                      "id": "q1",
-                      "text": "What is the output of print(1 + 2)?",
-                      "type": "multiple_choice",
-                      "options": ["1", "2", "3", "12"],
-                      "correct_answer": "3"
-                    },
-                    ...
-                  ],
-                  "created_at": "2023-01-15T10:30:00Z"
-                }
-                ```
-                """
-            },
-            {
-                "endpoint": "/users/{user_id}/results",
-                "method": "GET",
-                "description": "Get quiz results for a specific user",
-                "parameters": "user_id: The ID of the user",
-                "response": """
-                ```json
-                {
-                  "user_id": "456",
-                  "results": [
-                    {
-                      "quiz_id": "123",
-                      "quiz_title": "Python Basics Quiz",
-                      "score": 85.5,
-                      "completed_at": "2023-01-20T14:22:15Z"
-                    },
-                    ...
-                  ]
-                }
-                ```
-                """
-            },
-            {
-                "endpoint": "/analytics/performance",
-                "method": "GET",
-                "description": "Get performance analytics across all quizzes",
-                "parameters": "period (optional): Time period for analytics (day, week, month, year)",
-                "response": """
-                ```json
-                {
-                  "period": "month",
-                  "average_score": 78.3,
-                  "total_submissions": 156,
-                  "completion_rate": 92.5,
-                  "quiz_performance": [
-                    {
-                      "quiz_id": "123",
-                      "quiz_title": "Python Basics Quiz",
-                      "average_score": 82.1,
-                      "submissions": 48
-                    },
-                    ...
-                  ]
-                }
-                ```
-                """
-            }
-        ]
         
         # Display API endpoints in an expandable format
-        for i, endpoint in enumerate(api_endpoints):
-            with st.expander(f"{endpoint['method']} {endpoint['endpoint']} - {endpoint['description']}"):
-                st.markdown(f"**Description:** {endpoint['description']}")
-                st.markdown(f"**Parameters:** {endpoint['parameters']}")
-                st.markdown(f"**Example Response:** {endpoint['response']}")
+        for endpoint in API_ENDPOINTS:
+            with st.expander(f"{endpoint.method} {endpoint.endpoint} - {endpoint.description}"):
+                # One markdown element per endpoint instead of one per field
+                st.markdown(
+                    f"**Description:** {endpoint.description}\n\n"
+                    f"**Parameters:** {endpoint.parameters}\n\n"
+                    f"**Example Response:** {endpoint.response}"
+                )
                 
-                # Copy endpoint button
-                if st.button(f"Copy Endpoint", key=f"copy_endpoint_{i}"):
-                    # This would use JavaScript in a real app, but for demo purposes we'll just show a success message
-                    st.success(f"Copied: {endpoint['endpoint']}")
+                # Copy endpoint (st.code provides a copy-to-clipboard control)
+                with st.popover("Copy Endpoint"):
+                    st.code(endpoint.endpoint, language=None)
         
         # Code Examples
         st.markdown("### Code Examples")
@@ -4058,7 +4150,7 @@ curl -X GET "https://api.pythonprogramming.platform/v1/analytics/performance?per
                 st.markdown(code)
     
     # API Testing Tab
-    with api_tabs[1]:
+    elif api_section == "API Testing":
         st.subheader("API Testing Tool")
         
         # API request form
@@ -4127,42 +4219,14 @@ curl -X GET "https://api.pythonprogramming.platform/v1/analytics/performance?per
                 
                 # Display response
                 st.markdown(f"**Status Code:** {status_code}")
-                st.json(mock_response)
+                st.code(format_json(mock_response), language="json")
     
     # API Keys Tab
-    with api_tabs[2]:
+    elif api_section == "API Keys":
         st.subheader("API Key Management")
         
-        # Sample API keys (in a real application, these would come from a database)
-        api_keys = [
-            {
-                "id": "1",
-                "name": "Production Key",
-                "key": "pk_live_4f8h3j9g2k5l7m6n9p0q",
-                "created": "2023-01-10",
-                "last_used": "2023-03-15",
-                "status": "active"
-            },
-            {
-                "id": "2",
-                "name": "Development Key",
-                "key": "pk_test_1a2b3c4d5e6f7g8h9i0j",
-                "created": "2023-02-05",
-                "last_used": "2023-03-14",
-                "status": "active"
-            },
-            {
-                "id": "3",
-                "name": "Test Key",
-                "key": "pk_test_7y6t5r4e3w2q1p0o9i8u",
-                "created": "2023-02-20",
-                "last_used": "2023-02-25",
-                "status": "revoked"
-            }
-        ]
-        
         # Display API keys in a table
-        api_keys_df = pd.DataFrame(api_keys)
+        api_keys_df = pd.DataFrame.from_records(API_KEYS, columns=ApiKey._fields)
         st.dataframe(api_keys_df, use_container_width=True)
         
         # Create a new API key
@@ -4187,7 +4251,7 @@ curl -X GET "https://api.pythonprogramming.platform/v1/analytics/performance?per
                 st.info("Make sure to copy this key now. For security reasons, you won't be able to see it again.")
     
     # Usage Statistics Tab
-    with api_tabs[3]:
+    elif api_section == "Usage Statistics":
         st.subheader("API Usage Statistics")
         
         # Time period selector
@@ -4224,7 +4288,7 @@ curl -X GET "https://api.pythonprogramming.platform/v1/analytics/performance?per
         })
         
         # Format dates
-        usage_data['formatted_date'] = usage_data['date'].dt.strftime(date_format)
+        usage_data['formatted_date'] = format_datetimes(usage_data['date'], date_format)
         
         # Ensure non-negative values
         usage_data['requests'] = usage_data['requests'].apply(lambda x: max(0, int(x)))
@@ -4260,27 +4324,22 @@ curl -X GET "https://api.pythonprogramming.platform/v1/analytics/performance?per
         # Display usage chart
         st.markdown("### API Requests Over Time")
         
+        # Wide format already gives one series per column
         chart_data = pd.DataFrame({
-            'date': usage_data['formatted_date'],
-            'Requests': usage_data['requests'],
-            'Errors': usage_data['errors']
-        }).melt(id_vars=['date'], var_name='metric', value_name='count')
+            'Requests': usage_data['requests'].to_numpy(),
+            'Errors': usage_data['errors'].to_numpy()
+        }, index=pd.Index(usage_data['formatted_date'], name='date'))
         
-        st.bar_chart(chart_data.pivot(index='date', columns='metric', values='count'))
+        st.bar_chart(chart_data)
         
         # Top endpoints
         st.markdown("### Top API Endpoints")
         
         # Sample endpoint data
-        endpoints = [
-            {"endpoint": "/quizzes", "requests": int(total_requests * 0.35), "avg_response_time": 120},
-            {"endpoint": "/users/{id}/results", "requests": int(total_requests * 0.25), "avg_response_time": 200},
-            {"endpoint": "/analytics/performance", "requests": int(total_requests * 0.15), "avg_response_time": 350},
-            {"endpoint": "/quizzes/{id}", "requests": int(total_requests * 0.15), "avg_response_time": 100},
-            {"endpoint": "/users", "requests": int(total_requests * 0.10), "avg_response_time": 150}
-        ]
-        
-        endpoints_df = pd.DataFrame(endpoints)
+        endpoints_df = pd.DataFrame.from_records(
+            [(u.endpoint, int(total_requests * u.share), u.avg_response_time) for u in TOP_ENDPOINT_USAGE],
+            columns=["endpoint", "requests", "avg_response_time"]
+        )
         st.dataframe(endpoints_df, use_container_width=True)
         
         # Response time distribution
@@ -4342,234 +4401,35 @@ def render_developer_logs_page():
     access_log_file = os.path.join(log_dir, "access.log")
     query_log_file = os.path.join(log_dir, "query.log")
     
-    # Create sample logs if files don't exist or are empty (for demonstration)
-    create_sample_logs(error_log_file, access_log_file, query_log_file)
-    
-    # Log type tabs
-    log_tabs = st.tabs(["Error Logs", "Access Logs", "Database Queries", "System Events"])
+    # Create sample logs if files don't exist or are empty (for demonstration).
+    # Only checked once per session so reruns skip the three stat calls.
+    if not st.session_state.get("sample_logs_ready"):
+        create_sample_logs(error_log_file, access_log_file, query_log_file)
+        st.session_state.sample_logs_ready = True
+    
+    # Log type selector (only the selected log is read and parsed on each rerun)
+    log_section = st.radio(
+        "Log Type",
+        ["Error Logs", "Access Logs", "Database Queries", "System Events"],
+        horizontal=True,
+        label_visibility="collapsed",
+        key="log_section"
+    )
     
     # Error Logs Tab
-    with log_tabs[0]:
-        st.subheader("Application Error Logs")
-        
-        # Filter options
-        error_filter_col1, error_filter_col2, error_filter_col3 = st.columns(3)
-        
-        with error_filter_col1:
-            error_time_filter = st.selectbox(
-                "Time Range", 
-                ["All Time", "Last Hour", "Last 24 Hours", "Last 7 Days", "Last 30 Days"],
-                key="error_time_filter"
-            )
-        
-        with error_filter_col2:
-            error_severity = st.selectbox(
-                "Severity Level",
-                ["All", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
-                key="error_severity"
-            )
-        
-        with error_filter_col3:
-            error_search = st.text_input("Search Errors", key="error_search")
-        
-        # Read and parse error logs
-        error_logs = read_log_file(error_log_file, "error")
-        
-        # Filter logs based on user selection
-        error_logs = filter_logs(error_logs, error_time_filter, error_severity, error_search)
-        
-        # Display log data
-        if error_logs:
-            # Convert to DataFrame for better display
-            error_df = pd.DataFrame(error_logs)
-            
-            # Add colored severity indicators
-            def highlight_severity(val):
-                if val == "CRITICAL":
-                    return "background-color: #FFCCCC"
-                elif val == "ERROR":
-                    return "background-color: #FFDDCC"
-                elif val == "WARNING":
-                    return "background-color: #FFFFCC"
-                else:
-                    return ""
-            
-            # Apply styling (using .map instead of deprecated .applymap)
-            styled_error_df = error_df.style.map(highlight_severity, subset=["severity"])
-            
-            # Show dataframe
-            st.dataframe(styled_error_df, use_container_width=True)
-            
-            # Download button
-            error_csv = error_df.to_csv(index=False).encode('utf-8')
-            st.download_button(
-                label="Download Error Logs",
-                data=error_csv,
-                file_name='error_logs.csv',
-                mime='text/csv'
-            )
-        else:
-            st.info("No error logs found matching the criteria.")
-        
-        # Quick actions for error logs
-        if st.button("Clear Error Logs", key="clear_error_logs"):
-            try:
-                # Clear the file
-                with open(error_log_file, 'w') as f:
-                    f.write("")
-                st.success("Error logs cleared successfully.")
-                st.rerun()
-            except Exception as e:
-                st.error(f"Failed to clear error logs: {str(e)}")
+    if log_section == "Error Logs":
+        _render_error_logs(error_log_file)
     
     # Access Logs Tab
-    with log_tabs[1]:
-        st.subheader("User Access Logs")
-        
-        # Filter options
-        access_filter_col1, access_filter_col2, access_filter_col3 = st.columns(3)
-        
-        with access_filter_col1:
-            access_time_filter = st.selectbox(
-                "Time Range", 
-                ["All Time", "Last Hour", "Last 24 Hours", "Last 7 Days", "Last 30 Days"],
-                key="access_time_filter"
-            )
-        
-        with access_filter_col2:
-            access_user_filter = st.selectbox(
-                "User Type",
-                ["All", "student", "professor", "developer"],
-                key="access_user_filter"
-            )
-        
-        with access_filter_col3:
-            access_search = st.text_input("Search Access Logs", key="access_search")
-        
-        # Read and parse access logs
-        access_logs = read_log_file(access_log_file, "access")
-        
-        # Filter logs based on user selection
-        access_logs = filter_logs(access_logs, access_time_filter, access_user_filter, access_search)
-        
-        # Display log data
-        if access_logs:
-            # Convert to DataFrame for better display
-            access_df = pd.DataFrame(access_logs)
-            
-            # Show dataframe
-            st.dataframe(access_df, use_container_width=True)
-            
-            # Download button
-            access_csv = access_df.to_csv(index=False).encode('utf-8')
-            st.download_button(
-                label="Download Access Logs",
-                data=access_csv,
-                file_name='access_logs.csv',
-                mime='text/csv'
-            )
-            
-            # User access statistics
-            if "user_id" in access_df.columns:
-                st.subheader("User Access Statistics")
-                
-                # Count accesses by user
-                user_counts = access_df["user_id"].value_counts().reset_index()
-                user_counts.columns = ["User ID", "Access Count"]
-                
-                # Display as bar chart
-                st.bar_chart(user_counts.set_index("User ID"))
-        else:
-            st.info("No access logs found matching the criteria.")
+    elif log_section == "Access Logs":
+        _render_access_logs(access_log_file)
     
     # Database Queries Tab
-    with log_tabs[2]:
-        st.subheader("Database Query Logs")
-        
-        # Filter options
-        query_filter_col1, query_filter_col2, query_filter_col3 = st.columns(3)
-        
-        with query_filter_col1:
-            query_time_filter = st.selectbox(
-                "Time Range", 
-                ["All Time", "Last Hour", "Last 24 Hours", "Last 7 Days", "Last 30 Days"],
-                key="query_time_filter"
-            )
-        
-        with query_filter_col2:
-            query_type_filter = st.selectbox(
-                "Query Type",
-                ["All", "SELECT", "INSERT", "UPDATE", "DELETE", "CREATE", "ALTER", "DROP"],
-                key="query_type_filter"
-            )
-        
-        with query_filter_col3:
-            query_search = st.text_input("Search Queries", key="query_search")
-        
-        # Read and parse query logs
-        query_logs = read_log_file(query_log_file, "query")
-        
-        # Filter logs based on user selection
-        query_logs = filter_logs(query_logs, query_time_filter, query_type_filter, query_search)
-        
-        # Display log data
-        if query_logs:
-            # Convert to DataFrame for better display
-            query_df = pd.DataFrame(query_logs)
-            
-            # Color code by query type
-            def highlight_query_type(val):
-                if val == "SELECT":
-                    return "background-color: #E6F3FF"
-                elif val == "INSERT":
-                    return "background-color: #E6FFE6"
-                elif val == "UPDATE":
-                    return "background-color: #FFF9E6"
-                elif val == "DELETE":
-                    return "background-color: #FFE6E6"
-                else:
-                    return ""
-            
-            # Apply styling if query_type column exists
-            if "query_type" in query_df.columns:
-                styled_query_df = query_df.style.map(highlight_query_type, subset=["query_type"])
-                st.dataframe(styled_query_df, use_container_width=True)
-            else:
-                st.dataframe(query_df, use_container_width=True)
-            
-            # Download button
-            query_csv = query_df.to_csv(index=False).encode('utf-8')
-            st.download_button(
-                label="Download Query Logs",
-                data=query_csv,
-                file_name='query_logs.csv',
-                mime='text/csv'
-            )
-            
-            # Query performance analysis
-            if "duration_ms" in query_df.columns:
-                st.subheader("Query Performance Analysis")
-                
-                # Get average duration by query type
-                if "query_type" in query_df.columns:
-                    performance_data = query_df.groupby("query_type")["duration_ms"].mean().reset_index()
-                    performance_data.columns = ["Query Type", "Avg. Duration (ms)"]
-                    
-                    # Display as bar chart
-                    st.bar_chart(performance_data.set_index("Query Type"))
-                
-                # Show slow queries
-                st.subheader("Slow Queries (>100ms)")
-                slow_queries = query_df[query_df["duration_ms"] > 100]
-                if not slow_queries.empty:
-                    st.dataframe(slow_queries, use_container_width=True)
-                else:
-                    st.info("No slow queries found.")
-        else:
-            st.info("No query logs found matching the criteria.")
+    elif log_section == "Database Queries":
+        _render_query_logs(query_log_file)
     
     # System Events Tab
-    with log_tabs[3]:
+    elif log_section == "System Events":
         st.subheader("System Events")
         
         # Display system startup/shutdown events, configuration changes, etc.
@@ -4625,19 +4485,9 @@ def render_developer_logs_page():
                 # Archive logs with timestamp
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 
-                # Archive each log file
-                for log_file in [error_log_file, access_log_file, query_log_file]:
-                    if os.path.exists(log_file):
-                        filename = os.path.basename(log_file)
-                        archive_path = os.path.join(archive_dir, f"{filename}_{timestamp}")
-                        
-                        # Copy to archive
-                        with open(log_file, 'r') as src, open(archive_path, 'w') as dst:
-                            dst.write(src.read())
-                        
-                        # Clear original
-                        with open(log_file, 'w') as f:
-                            f.write("")
+                # Archive all log files concurrently
+                log_files = [f for f in (error_log_file, access_log_file, query_log_file) if os.path.exists(f)]
+                archive_log_files(log_files, archive_dir, timestamp)
                 
                 st.success(f"Logs archived successfully to {archive_dir}")
                 st.rerun()
@@ -4659,37 +4509,334 @@ def render_developer_logs_page():
     with log_mgmt_col3:
         if st.button("Download All Logs (ZIP)", use_container_width=True):
             try:
-                import io
                 import zipfile
                 
-                # Create a ZIP file in memory
-                zip_buffer = io.BytesIO()
-                with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                    for log_file in [error_log_file, access_log_file, query_log_file]:
-                        if os.path.exists(log_file):
-                            filename = os.path.basename(log_file)
-                            with open(log_file, 'r') as f:
-                                zip_file.writestr(filename, f.read())
+                log_files = [f for f in (error_log_file, access_log_file, query_log_file) if os.path.exists(f)]
                 
-                # Set buffer position to start
-                zip_buffer.seek(0)
+                # Small archives are stored uncompressed; larger ones use the fastest deflate
+                # level, which keeps most of the size reduction on text logs at a fraction of the CPU
+                total_size = sum(os.path.getsize(f) for f in log_files)
+                compression = zipfile.ZIP_STORED if total_size < ZIP_STORE_THRESHOLD else zipfile.ZIP_DEFLATED
+                
+                # st.download_button keeps the archive in memory until it is downloaded, so
+                # the ZIP is built in memory too rather than in a temp file that is read back
+                zip_buffer = io.BytesIO()
+                with zipfile.ZipFile(zip_buffer, 'w', compression, compresslevel=1, allowZip64=True) as zip_file:
+                    for log_file in log_files:
+                        filename = os.path.basename(log_file)
+                        # A plain buffered copy rather than a memory map: another session
+                        # can truncate the log while the archive is being built
+                        with open(log_file, 'rb') as src, zip_file.open(filename, 'w') as entry:
+                            shutil.copyfileobj(src, entry, 1024 * 1024)
                 
                 # Offer download
                 st.download_button(
                     label="Download ZIP",
-                    data=zip_buffer,
+                    data=zip_buffer.getvalue(),
                     file_name="all_logs.zip",
                     mime="application/zip"
                 )
             except Exception as e:
                 st.error(f"Failed to create ZIP file: {str(e)}")
 
+@st.fragment
+def _render_error_logs(error_log_file):
+    """Error log view; runs as a fragment so its filters only rerun this section."""
+    st.subheader("Application Error Logs")
+    
+    # Filter options
+    error_filter_col1, error_filter_col2, error_filter_col3 = st.columns(3)
+    
+    with error_filter_col1:
+        error_time_filter = st.selectbox(
+            "Time Range", 
+            list(LOG_TIME_RANGES),
+            key="error_time_filter"
+        )
+    
+    with error_filter_col2:
+        error_severity = st.selectbox(
+            "Severity Level",
+            ["All", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+            key="error_severity"
+        )
+    
+    with error_filter_col3:
+        error_search = st.text_input("Search Errors", key="error_search")
+    
+    # Read and parse error logs
+    error_logs = read_log_file(error_log_file, "error")
+    
+    # Filter logs based on user selection
+    error_df = filter_logs(error_logs, log_time_cutoff(error_time_filter), error_severity, error_search)
+    
+    # Display log data
+    if not error_df.empty:
+        # Colour severity cells (skipped for very large tables)
+        styled_error_df = highlight_log_column(error_df, "severity", SEVERITY_HIGHLIGHTS)
+        
+        # Show dataframe
+        st.dataframe(styled_error_df, use_container_width=True)
+        
+        # Download button
+        error_csv = logs_to_csv_bytes(error_df)
+        st.download_button(
+            label="Download Error Logs",
+            data=error_csv,
+            file_name='error_logs.csv',
+            mime='text/csv'
+        )
+    else:
+        st.info("No error logs found matching the criteria.")
+    
+    # Quick actions for error logs
+    if st.button("Clear Error Logs", key="clear_error_logs"):
+        try:
+            # Clear the file
+            os.truncate(error_log_file, 0)
+            st.success("Error logs cleared successfully.")
+            st.rerun()
+        except Exception as e:
+            st.error(f"Failed to clear error logs: {str(e)}")
+
+@st.fragment
+def _render_access_logs(access_log_file):
+    """Access log view with per-user statistics, rendered as a fragment."""
+    st.subheader("User Access Logs")
+    
+    # Filter options
+    access_filter_col1, access_filter_col2, access_filter_col3 = st.columns(3)
+    
+    with access_filter_col1:
+        access_time_filter = st.selectbox(
+            "Time Range", 
+            list(LOG_TIME_RANGES),
+            key="access_time_filter"
+        )
+    
+    with access_filter_col2:
+        access_user_filter = st.selectbox(
+            "User Type",
+            ["All", "student", "professor", "developer"],
+            key="access_user_filter"
+        )
+    
+    with access_filter_col3:
+        access_search = st.text_input("Search Access Logs", key="access_search")
+    
+    # Read and parse access logs
+    access_logs = read_log_file(access_log_file, "access")
+    
+    # Filter logs based on user selection
+    access_df = filter_logs(access_logs, log_time_cutoff(access_time_filter), access_user_filter, access_search)
+    
+    # Display log data
+    if not access_df.empty:
+        # Show dataframe
+        st.dataframe(access_df, use_container_width=True)
+        
+        # Download button
+        access_csv = logs_to_csv_bytes(access_df)
+        st.download_button(
+            label="Download Access Logs",
+            data=access_csv,
+            file_name='access_logs.csv',
+            mime='text/csv'
+        )
+        
+        # User access statistics
+        if "user_id" in access_df.columns:
+            st.subheader("User Access Statistics")
+            
+            # Count accesses by user (hash aggregate, no frequency sort needed for the chart)
+            user_counts = access_df.groupby("user_id", sort=False, observed=True).size()
+            user_counts.index.name = "User ID"
+            
+            # Display as bar chart
+            st.bar_chart(user_counts.rename("Access Count"))
+    else:
+        st.info("No access logs found matching the criteria.")
+
+@st.fragment
+def _render_query_logs(query_log_file):
+    """Database query log view with performance analysis, rendered as a fragment."""
+    st.subheader("Database Query Logs")
+    
+    # Filter options
+    query_filter_col1, query_filter_col2, query_filter_col3 = st.columns(3)
+    
+    with query_filter_col1:
+        query_time_filter = st.selectbox(
+            "Time Range", 
+            list(LOG_TIME_RANGES),
+            key="query_time_filter"
+        )
+    
+    with query_filter_col2:
+        query_type_filter = st.selectbox(
+            "Query Type",
+            ["All", "SELECT", "INSERT", "UPDATE", "DELETE", "CREATE", "ALTER", "DROP"],
+            key="query_type_filter"
+        )
+    
+    with query_filter_col3:
+        query_search = st.text_input("Search Queries", key="query_search")
+    
+    # Read and parse query logs
+    query_logs = read_log_file(query_log_file, "query")
+    
+    # Filter logs based on user selection
+    query_df = filter_logs(query_logs, log_time_cutoff(query_time_filter), query_type_filter, query_search)
+    
+    # Display log data
+    if not query_df.empty:
+        # Color code by query type (no-op if the column is missing)
+        styled_query_df = highlight_log_column(query_df, "query_type", QUERY_TYPE_HIGHLIGHTS)
+        st.dataframe(styled_query_df, use_container_width=True)
+        
+        # Download button
+        query_csv = logs_to_csv_bytes(query_df)
+        st.download_button(
+            label="Download Query Logs",
+            data=query_csv,
+            file_name='query_logs.csv',
+            mime='text/csv'
+        )
+        
+        # Query performance analysis
+        if "duration_ms" in query_df.columns:
+            st.subheader("Query Performance Analysis")
+            
+            # Mark slow queries once from the raw duration array
+            slow_mask = query_df["duration_ms"].to_numpy() > 100
+            
+            # Get average duration by query type
+            if "query_type" in query_df.columns:
+                performance_data = query_df.groupby("query_type", sort=False).agg(
+                    avg_duration=("duration_ms", "mean")
+                )
+                performance_data.index.name = "Query Type"
+                performance_data.columns = ["Avg. Duration (ms)"]
+                
+                # Display as bar chart
+                st.bar_chart(performance_data)
+            
+            # Show slow queries
+            st.subheader("Slow Queries (>100ms)")
+            slow_queries = query_df.loc[slow_mask]
+            if not slow_queries.empty:
+                st.dataframe(slow_queries, use_container_width=True)
+            else:
+                st.info("No slow queries found.")
+    else:
+        st.info("No query logs found matching the criteria.")
+
 # Helper functions for log management
 
+# Cell styles used to highlight log tables
+SEVERITY_HIGHLIGHTS = {
+    "CRITICAL": "background-color: #FFCCCC",
+    "ERROR": "background-color: #FFDDCC",
+    "WARNING": "background-color: #FFFFCC",
+}
+QUERY_TYPE_HIGHLIGHTS = {
+    "SELECT": "background-color: #E6F3FF",
+    "INSERT": "background-color: #E6FFE6",
+    "UPDATE": "background-color: #FFF9E6",
+    "DELETE": "background-color: #FFE6E6",
+}
+
+# Column layout of each pipe-delimited log file
+LOG_COLUMNS = {
+    "error": ["timestamp", "severity", "component", "message", "user_id"],
+    "access": ["timestamp", "user_id", "user_type", "action", "ip_address", "status"],
+    "query": ["timestamp", "query_type", "query", "table", "duration_ms", "user_id"],
+}
+
+# Time range filter options and how far back each one reaches
+LOG_TIME_RANGES = {
+    "All Time": None,
+    "Last Hour": timedelta(hours=1),
+    "Last 24 Hours": timedelta(days=1),
+    "Last 7 Days": timedelta(days=7),
+    "Last 30 Days": timedelta(days=30),
+}
+
+def log_time_cutoff(time_range):
+    """Return the earliest datetime inside a LOG_TIME_RANGES option, or None for all time.
+    
+    Called on every run of a log view, including fragment reruns, so "now" is never stale.
+    """
+    delta = LOG_TIME_RANGES[time_range]
+    return datetime.now() - delta if delta is not None else None
+
+# Above this many rows the Styler HTML costs more than the colours are worth
+MAX_STYLED_LOG_ROWS = 500
+
+def highlight_log_column(df, column, highlights):
+    """Colour one column of a log table using a single vectorized map instead of per-cell callbacks."""
+    if column not in df.columns or len(df) > MAX_STYLED_LOG_ROWS:
+        return df
+    
+    cell_styles = df[column].map(highlights).fillna("")
+    return df.style.apply(lambda _: cell_styles, subset=[column])
+
+def archive_log_file(log_file, archive_dir, timestamp):
+    """Copy one log file into archive_dir with a timestamp suffix, then empty the original."""
+    archive_path = os.path.join(archive_dir, f"{os.path.basename(log_file)}_{timestamp}")
+    
+    # copyfile uses os.sendfile where available, so the bytes never pass through Python
+    shutil.copyfile(log_file, archive_path)
+    
+    # Clear original
+    os.truncate(log_file, 0)
+    return archive_path
+
+def archive_log_files(log_files, archive_dir, timestamp):
+    """Archive several log files at once and return their archive paths.
+    
+    Each file is rotated on its own worker thread. The copies release the GIL, so the
+    I/O for different files overlaps instead of running one file after another.
+    """
+    if not log_files:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=len(log_files)) as executor:
+        futures = [executor.submit(archive_log_file, f, archive_dir, timestamp) for f in log_files]
+        return [future.result() for future in futures]
+
+# Log bundles smaller than this are zipped without compression
+ZIP_STORE_THRESHOLD = 1024 * 1024
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _cached_csv_bytes(fingerprint, _df):
+    """Serialize a DataFrame to UTF-8 CSV bytes, cached on its content fingerprint.
+    
+    Only the last few filter results are kept, since every new search gives a new entry.
+    """
+    buffer = io.BytesIO()
+    _df.to_csv(buffer, index=False, encoding='utf-8')
+    return buffer.getvalue()
+
+def logs_to_csv_bytes(df):
+    """Return CSV bytes for a log DataFrame without re-encoding unchanged data on every rerun."""
+    # Digest the per-row hashes in order; a sum would match the same rows in another order
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    fingerprint = (tuple(df.columns), len(df), hashlib.blake2b(row_hashes.tobytes(), digest_size=16).hexdigest())
+    return _cached_csv_bytes(fingerprint, df)
+
+def sample_log_timestamps(rng, count):
+    """Draw count random log timestamps from the last 30 days in one vectorized pass."""
+    offsets = (
+        rng.integers(0, 31, count) * 24 * 60
+        + rng.integers(0, 24, count) * 60
+        + rng.integers(0, 60, count)
+    )
+    return (pd.Timestamp.now() - pd.to_timedelta(offsets, unit="m")).strftime(LOG_TIMESTAMP_FORMAT)
+
 def create_sample_logs(error_log_file, access_log_file, query_log_file):
     """Create sample logs for demonstration if files don't exist or are empty."""
-    import random
-    from datetime import datetime, timedelta
+    rng = np.random.default_rng()
     
     # Create error log samples
     if not os.path.exists(error_log_file) or os.path.getsize(error_log_file) == 0:
@@ -4698,20 +4845,24 @@ def create_sample_logs(error_log_file, access_log_file, query_log_file):
         severity_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         components = ["database", "auth", "quiz", "user", "api", "file_system"]
         
+        # Generate 50 sample error logs
+        count = 50
+        timestamps = sample_log_timestamps(rng, count)
+        severities = rng.choice(severity_levels, count)
+        error_components = rng.choice(components, count)
+        error_msgs = rng.choice(error_types, count)
+        user_ids = rng.integers(1, 11, count)
+        
+        # Format: timestamp|severity|component|message|user_id
+        lines = [
+            f"{timestamp}|{severity}|{component}|{error_msg}|{user_id}\n"
+            for timestamp, severity, component, error_msg, user_id in zip(
+                timestamps, severities, error_components, error_msgs, user_ids
+            )
+        ]
+        
         with open(error_log_file, 'w') as f:
-            # Generate 50 sample error logs
-            for i in range(50):
-                timestamp = (datetime.now() - timedelta(days=random.randint(0, 30), 
-                                                      hours=random.randint(0, 23), 
-                                                      minutes=random.randint(0, 59))).strftime("%Y-%m-%d %H:%M:%S")
-                severity = random.choice(severity_levels)
-                component = random.choice(components)
-                error_msg = random.choice(error_types)
-                user_id = random.randint(1, 10)
-                
-                # Format: timestamp|severity|component|message|user_id
-                log_entry = f"{timestamp}|{severity}|{component}|{error_msg}|{user_id}\n"
-                f.write(log_entry)
+            f.write("".join(lines))
     
     # Create access log samples
     if not os.path.exists(access_log_file) or os.path.getsize(access_log_file) == 0:
@@ -4720,192 +4871,239 @@ def create_sample_logs(error_log_file, access_log_file, query_log_file):
                  "update_profile", "reset_password", "view_analytics"]
         ips = ["192.168.1." + str(i) for i in range(1, 20)]
         
+        # Generate 100 sample access logs
+        count = 100
+        timestamps = sample_log_timestamps(rng, count)
+        user_ids = rng.integers(1, 21, count)
+        access_user_types = rng.choice(user_types, count)
+        access_actions = rng.choice(actions, count)
+        access_ips = rng.choice(ips, count)
+        statuses = np.where(rng.random(count) > 0.1, "success", "failed")
+        
+        # Format: timestamp|user_id|user_type|action|ip|status
+        lines = [
+            f"{timestamp}|{user_id}|{user_type}|{action}|{ip}|{status}\n"
+            for timestamp, user_id, user_type, action, ip, status in zip(
+                timestamps, user_ids, access_user_types, access_actions, access_ips, statuses
+            )
+        ]
+        
         with open(access_log_file, 'w') as f:
-            # Generate 100 sample access logs
-            for i in range(100):
-                timestamp = (datetime.now() - timedelta(days=random.randint(0, 30), 
-                                                      hours=random.randint(0, 23), 
-                                                      minutes=random.randint(0, 59))).strftime("%Y-%m-%d %H:%M:%S")
-                user_id = random.randint(1, 20)
-                user_type = random.choice(user_types)
-                action = random.choice(actions)
-                ip = random.choice(ips)
-                status = "success" if random.random() > 0.1 else "failed"
-                
-                # Format: timestamp|user_id|user_type|action|ip|status
-                log_entry = f"{timestamp}|{user_id}|{user_type}|{action}|{ip}|{status}\n"
-                f.write(log_entry)
+            f.write("".join(lines))
     
     # Create query log samples
     if not os.path.exists(query_log_file) or os.path.getsize(query_log_file) == 0:
         query_types = ["SELECT", "INSERT", "UPDATE", "DELETE"]
         tables = ["users", "quizzes", "quiz_submissions", "practice_quizzes"]
         
+        # Sample query text for each query type
+        query_templates = {
+            "SELECT": "SELECT * FROM {table} WHERE id = {row_id}",
+            "INSERT": "INSERT INTO {table} (col1, col2) VALUES (val1, val2)",
+            "UPDATE": "UPDATE {table} SET col1 = val1 WHERE id = {row_id}",
+            "DELETE": "DELETE FROM {table} WHERE id = {row_id}",
+        }
+        
+        # Generate 75 sample query logs
+        count = 75
+        timestamps = sample_log_timestamps(rng, count)
+        sample_query_types = rng.choice(query_types, count)
+        sample_tables = rng.choice(tables, count)
+        row_ids = rng.integers(1, 101, count)
+        durations = rng.integers(1, 501, count)
+        user_ids = rng.integers(1, 11, count)
+        
+        # Format: timestamp|query_type|query|table|duration_ms|user_id
+        lines = [
+            f"{timestamp}|{query_type}|{query_templates[query_type].format(table=table, row_id=row_id)}"
+            f"|{table}|{duration_ms}|{user_id}\n"
+            for timestamp, query_type, table, row_id, duration_ms, user_id in zip(
+                timestamps, sample_query_types, sample_tables, row_ids, durations, user_ids
+            )
+        ]
+        
         with open(query_log_file, 'w') as f:
-            # Generate 75 sample query logs
-            for i in range(75):
-                timestamp = (datetime.now() - timedelta(days=random.randint(0, 30), 
-                                                      hours=random.randint(0, 23), 
-                                                      minutes=random.randint(0, 59))).strftime("%Y-%m-%d %H:%M:%S")
-                query_type = random.choice(query_types)
-                table = random.choice(tables)
-                
-                # Construct sample query
-                if query_type == "SELECT":
-                    query = f"SELECT * FROM {table} WHERE id = {random.randint(1, 100)}"
-                elif query_type == "INSERT":
-                    query = f"INSERT INTO {table} (col1, col2) VALUES (val1, val2)"
-                elif query_type == "UPDATE":
-                    query = f"UPDATE {table} SET col1 = val1 WHERE id = {random.randint(1, 100)}"
-                else:  # DELETE
-                    query = f"DELETE FROM {table} WHERE id = {random.randint(1, 100)}"
-                
-                duration_ms = random.randint(1, 500)
-                user_id = random.randint(1, 10)
-                
-                # Format: timestamp|query_type|query|table|duration_ms|user_id
-                log_entry = f"{timestamp}|{query_type}|{query}|{table}|{duration_ms}|{user_id}\n"
-                f.write(log_entry)
+            f.write("".join(lines))
+
+# Log timestamps are fixed width, so the digits always sit at the same offsets
+LOG_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+TIMESTAMP_DIGIT_OFFSETS = [0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18]
+TIMESTAMP_DIGIT_WEIGHTS = 10 ** np.arange(len(TIMESTAMP_DIGIT_OFFSETS) - 1, -1, -1, dtype=np.int64)
+
+def pack_timestamps(timestamps):
+    """Pack "YYYY-MM-DD HH:MM:SS" strings into YYYYMMDDHHMMSS integers without building datetimes.
+    
+    Packed values sort the same way as the timestamps they encode. Malformed strings become -1.
+    """
+    chars = np.asarray(timestamps, dtype="U19")
+    
+    # Each U19 string is 19 UCS-4 code points; pick out the digit positions and weight them
+    digits = chars.view(np.uint32).reshape(-1, 19)[:, TIMESTAMP_DIGIT_OFFSETS].astype(np.int64) - ord("0")
+    valid = ((digits >= 0) & (digits <= 9)).all(axis=1)
+    return np.where(valid, digits @ TIMESTAMP_DIGIT_WEIGHTS, -1)
 
 def read_log_file(file_path, log_type):
-    """Read and parse log files into structured data."""
-    if not os.path.exists(file_path):
-        return []
+    """Read and parse a log file into a DataFrame.
+    
+    Besides the LOG_COLUMNS for the log type, the frame carries two columns used by
+    filter_logs: "_ts" holds packed integer timestamps (see pack_timestamps) and "_search"
+    the lowercased row text. Rows are returned in chronological order. The frame is shared
+    between sessions and must not be modified in place.
+    """
+    future = submit_log_parse(file_path, log_type)
+    if future is None:
+        return pd.DataFrame(columns=LOG_COLUMNS[log_type] + ["_ts", "_search"])
+    
+    return future.result()
+
+def submit_log_parse(file_path, log_type):
+    """Start parsing a log file on the shared worker pool and return the parse future.
     
-    logs = []
+    Returns None if the file does not exist. Futures are cached until the file's
+    modification time or size changes, so repeated calls never parse twice.
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    
+    return _log_parse_future(file_path, log_type, stat.st_mtime_ns, stat.st_size)
+
+@st.cache_resource(show_spinner=False)
+def _log_parse_executor():
+    """Worker threads shared by all sessions for parsing log files."""
+    return ThreadPoolExecutor(max_workers=len(LOG_COLUMNS), thread_name_prefix="log-parse")
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _log_parse_future(file_path, log_type, mtime_ns, size):
+    """Submit a log file parse; mtime_ns and size only serve as the cache key."""
+    return _log_parse_executor().submit(parse_log_file, file_path, log_type, size)
+
+def parse_log_file(file_path, log_type, size):
+    """Parse a log file into a DataFrame (see read_log_file for the extra columns).
+    
+    Errors are logged and give an empty frame instead of raising, so a failed parse
+    never leaves a future that re-raises on every rerun until the file changes.
+    """
+    columns = LOG_COLUMNS[log_type]
+    empty_logs = pd.DataFrame(columns=columns + ["_ts", "_search"])
+    
+    if size == 0:
+        return empty_logs
     
     try:
-        with open(file_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                parts = line.split('|')
-                
-                if log_type == "error" and len(parts) >= 5:
-                    logs.append({
-                        "timestamp": parts[0],
-                        "severity": parts[1],
-                        "component": parts[2],
-                        "message": parts[3],
-                        "user_id": parts[4]
-                    })
-                elif log_type == "access" and len(parts) >= 6:
-                    logs.append({
-                        "timestamp": parts[0],
-                        "user_id": parts[1],
-                        "user_type": parts[2],
-                        "action": parts[3],
-                        "ip_address": parts[4],
-                        "status": parts[5]
-                    })
-                elif log_type == "query" and len(parts) >= 6:
-                    logs.append({
-                        "timestamp": parts[0],
-                        "query_type": parts[1],
-                        "query": parts[2],
-                        "table": parts[3],
-                        "duration_ms": int(parts[4]),
-                        "user_id": parts[5]
-                    })
+        # Parse an in-memory snapshot of the file. The worker can outlive the run that
+        # submitted it, and a live mapping would fault if a clear or archive truncated the
+        # file mid-parse
+        with open(file_path, 'rb') as f:
+            text = f.read().decode('utf-8', errors='replace')
+        
+        # Split every non-blank line into the schema fields plus one piece holding any extra
+        # fields. As with the line-by-line parser, lines with too few fields are skipped and
+        # extra fields are ignored. A field that is present but empty stays ""
+        lines = pd.Series(text.splitlines(), dtype=object).str.strip()
+        lines = lines[lines != ""]
+        fields = lines.str.split("|", n=len(columns), expand=True).reindex(columns=range(len(columns)))
+        fields = fields[fields[len(columns) - 1].notna()]
+        logs = fields.set_axis(columns, axis=1).astype(str).reset_index(drop=True)
+        
+        if "duration_ms" in logs.columns:
+            # Skip lines whose duration is empty or not a number, as before
+            durations = pd.to_numeric(logs["duration_ms"], errors="coerce")
+            logs = logs[durations.notna()].copy()
+            logs["duration_ms"] = durations[durations.notna()].astype("int32")
+        
+        # Pack timestamps once and order rows by them so time filtering is a binary search
+        logs["_ts"] = pack_timestamps(logs["timestamp"])
+        logs = logs.sort_values("_ts", kind="stable", ignore_index=True)
+        
+        # Lowercased copy of each whole row for search. The newline separator can't come
+        # from the search box, so a term never matches across two fields
+        search_text = logs[columns[0]].fillna("").astype(str)
+        for column in columns[1:]:
+            search_text = search_text + "\n" + logs[column].fillna("").astype(str)
+        logs["_search"] = search_text.str.lower()
     except Exception as e:
         print(f"Error reading log file {file_path}: {str(e)}")
+        return empty_logs
     
     return logs
 
-def filter_logs(logs, time_filter, type_filter, search_term):
-    """Filter logs based on user selection."""
-    if not logs:
-        return []
+def filter_logs(logs, time_threshold, type_filter, search_term):
+    """Filter a log DataFrame based on user selection.
     
-    filtered_logs = logs.copy()
-    
-    # Apply time filter
-    if time_filter != "All Time":
-        now = datetime.now()
-        time_threshold = None
-        
-        if time_filter == "Last Hour":
-            time_threshold = now - timedelta(hours=1)
-        elif time_filter == "Last 24 Hours":
-            time_threshold = now - timedelta(days=1)
-        elif time_filter == "Last 7 Days":
-            time_threshold = now - timedelta(days=7)
-        elif time_filter == "Last 30 Days":
-            time_threshold = now - timedelta(days=30)
-        
-        if time_threshold:
-            filtered_logs = [
-                log for log in filtered_logs
-                if "timestamp" in log and datetime.strptime(log["timestamp"], "%Y-%m-%d %H:%M:%S") >= time_threshold
-            ]
+    time_threshold is the earliest datetime to keep (see LOG_TIME_RANGES), or None for all time.
+    Returns only the visible log columns, newest entries first.
+    """
+    visible_columns = [c for c in logs.columns if not c.startswith("_")]
+    if logs.empty:
+        return logs[visible_columns]
+    
+    # Apply time filter. Rows are sorted by _ts, so a binary search finds the first
+    # row inside the window and everything from there on is kept
+    if time_threshold is not None:
+        packed_threshold = pack_timestamps([time_threshold.strftime(LOG_TIMESTAMP_FORMAT)])[0]
+        start = int(np.searchsorted(logs["_ts"].to_numpy(), packed_threshold, side="left"))
+        logs = logs.iloc[start:]
+    
+    # Combine the remaining filters into one boolean mask
+    mask = np.ones(len(logs), dtype=bool)
     
     # Apply type filter
     if type_filter != "All":
-        type_key = None
-        if "severity" in filtered_logs[0]:
-            type_key = "severity"
-        elif "user_type" in filtered_logs[0]:
-            type_key = "user_type"
-        elif "query_type" in filtered_logs[0]:
-            type_key = "query_type"
-        
+        type_key = next((key for key in ("severity", "user_type", "query_type") if key in logs.columns), None)
         if type_key:
-            filtered_logs = [log for log in filtered_logs if log.get(type_key) == type_filter]
+            mask &= (logs[type_key] == type_filter).to_numpy()
     
-    # Apply search filter
+    # Apply search filter against the precomputed row text
     if search_term:
-        search_term = search_term.lower()
-        filtered_logs = [
-            log for log in filtered_logs
-            if any(search_term in str(value).lower() for value in log.values())
-        ]
+        mask &= logs["_search"].str.contains(search_term.lower(), regex=False).to_numpy()
     
-    return filtered_logs
+    # Rows are stored oldest first; show the newest entries at the top
+    return logs.loc[mask, visible_columns].iloc[::-1].reset_index(drop=True)
 
+# The system event generators below produce demo data dated relative to now. Each one is
+# cached for a few minutes so logs page reruns reuse it without the timestamps going stale.
+@st.cache_data(ttl=300, max_entries=1, show_spinner=False)
 def generate_startup_history():
-    """Generate sample system startup history."""
-    from datetime import datetime, timedelta
-    import random
-    
+    """Generate sample system startup history (cached for five minutes)."""
+    rng = np.random.default_rng()
     now = datetime.now()
-    startup_events = []
     
-    # Generate startup events for the past 30 days
-    for i in range(30):
-        event_date = now - timedelta(days=i)
-        
-        # Skip some days randomly
-        if random.random() < 0.3:
-            continue
-        
-        # Generate 1-2 events per day
-        for j in range(random.randint(1, 2)):
-            hour = random.randint(6, 9)  # System typically starts in the morning
-            minute = random.randint(0, 59)
-            
-            event_time = event_date.replace(hour=hour, minute=minute)
-            
-            # Randomize startup duration and status
-            duration_sec = random.randint(5, 30)
-            status = "Success" if random.random() > 0.1 else "Failed"
-            
-            startup_events.append({
-                "timestamp": event_time.strftime("%Y-%m-%d %H:%M:%S"),
-                "event": "System Startup",
-                "duration_sec": duration_sec,
-                "status": status,
-                "version": "1.0." + str(random.randint(1, 15))
-            })
+    # Startup events for the past 30 days, skipping some days randomly
+    days = np.arange(30)
+    days = days[rng.random(len(days)) >= 0.3]
+    
+    # Generate 1-2 events per remaining day
+    days = np.repeat(days, rng.integers(1, 3, len(days)))
+    count = len(days)
+    if count == 0:
+        return []
+    
+    # System typically starts in the morning
+    start_minutes = rng.integers(6, 10, count) * 60 + rng.integers(0, 60, count)
+    event_times = (
+        pd.Timestamp(now.replace(hour=0, minute=0))
+        - pd.to_timedelta(days, unit="D")
+        + pd.to_timedelta(start_minutes, unit="m")
+    )
+    
+    startup_events = pd.DataFrame({
+        "timestamp": event_times.strftime(LOG_TIMESTAMP_FORMAT),
+        "event": "System Startup",
+        "duration_sec": rng.integers(5, 31, count),
+        "status": np.where(rng.random(count) > 0.1, "Success", "Failed"),
+        "version": np.char.add("1.0.", rng.integers(1, 16, count).astype(str))
+    })
     
     # Sort by timestamp descending
-    startup_events.sort(key=lambda x: x["timestamp"], reverse=True)
+    startup_events = startup_events.sort_values("timestamp", ascending=False)
     
-    return startup_events
+    return startup_events.to_dict("records")
 
+@st.cache_data(ttl=300, max_entries=1, show_spinner=False)
 def generate_config_changes():
-    """Generate sample configuration change history."""
+    """Generate sample configuration change history (cached for five minutes)."""
     from datetime import datetime, timedelta
     import random
     
@@ -4959,45 +5157,125 @@ def generate_config_changes():
     
     return config_changes
 
+@st.cache_data(ttl=300, max_entries=1, show_spinner=False)
 def generate_health_metrics():
-    """Generate sample system health metrics."""
-    from datetime import datetime, timedelta
-    import random
-    import numpy as np
+    """Generate sample system health metrics (cached for five minutes)."""
+    rng = np.random.default_rng()
+    
+    # Data points for the past 24 hours, every 15 minutes, oldest first for charting
+    points = 24 * 4
+    timestamps = pd.date_range(end=datetime.now(), periods=points, freq="15min")
+    steps_back = np.arange(points - 1, -1, -1)
+    
+    # Create somewhat realistic curves for CPU and memory usage
+    time_of_day = timestamps.hour.to_numpy() + timestamps.minute.to_numpy() / 60.0  # Hour as float
+    business_hours = (time_of_day >= 6) & (time_of_day <= 18)
+    daily_curve = np.sin(np.pi * (time_of_day - 6) / 12)
+    
+    # CPU usage peaks during business hours (9-17)
+    cpu_base = np.where(business_hours, 30 + 25 * daily_curve, 15)
+    cpu_percent = np.clip(cpu_base + rng.uniform(-5, 5, points), 5, 95)
+    
+    # Memory usage follows a similar pattern but with less variation
+    memory_base = np.where(business_hours, 40 + 15 * daily_curve, 30)
+    memory_percent = np.clip(memory_base + rng.uniform(-3, 3, points), 20, 90)
+    
+    # Disk usage grows slightly over time
+    disk_percent = 45 + steps_back * 0.01 + rng.uniform(-1, 1, points)
+    
+    health_data = pd.DataFrame({
+        "timestamp": timestamps.strftime(LOG_TIMESTAMP_FORMAT),
+        "cpu_percent": np.round(cpu_percent, 1),
+        "memory_percent": np.round(memory_percent, 1),
+        "disk_percent": np.round(disk_percent, 1),
+        "active_connections": np.where(business_hours, 10 + 15 * daily_curve, 5).astype(int)
+    })
     
-    now = datetime.now()
-    health_data = []
+    return health_data.to_dict("records")
+
+# Theme preview markup, filled in with the selected colors and font
+THEME_PREVIEW_TEMPLATE = """
+<div style="padding: 20px; background-color: {secondary_color}; border-radius: 10px; margin-bottom: 20px;">
+    <h3 style="color: {primary_color};">Sample Heading</h3>
+    <p style="font-family: {font_family}; color: #333;">This is a sample paragraph showing how your selected theme will look.</p>
+    <button style="background-color: {primary_color}; color: white; border: none; padding: 10px 20px; border-radius: 5px; cursor: pointer;">Sample Button</button>
+    <a href="#" style="color: {accent_color}; margin-left: 10px; text-decoration: none;">Sample Link</a>
+</div>
+"""
+
+@st.fragment
+def _render_theme_preview(primary_color, secondary_color, accent_color, font_family):
+    """Theme preview for the appearance settings, rendered as a fragment."""
+    st.markdown("### Theme Preview")
+    
+    preview_html = THEME_PREVIEW_TEMPLATE.format(
+        primary_color=primary_color,
+        secondary_color=secondary_color,
+        accent_color=accent_color,
+        font_family=font_family
+    )
     
-    # Generate data points for the past 24 hours, every 15 minutes
-    for i in range(24 * 4):
-        timestamp = now - timedelta(minutes=i * 15)
-        
-        # Create somewhat realistic curves for CPU and memory usage
-        time_of_day = timestamp.hour + timestamp.minute / 60.0  # Hour as float
-        
-        # CPU usage peaks during business hours (9-17)
-        cpu_base = 30 + 25 * np.sin(np.pi * (time_of_day - 6) / 12) if 6 <= time_of_day <= 18 else 15
-        cpu_percent = max(5, min(95, cpu_base + random.uniform(-5, 5)))
-        
-        # Memory usage follows a similar pattern but with less variation
-        memory_base = 40 + 15 * np.sin(np.pi * (time_of_day - 6) / 12) if 6 <= time_of_day <= 18 else 30
-        memory_percent = max(20, min(90, memory_base + random.uniform(-3, 3)))
-        
-        # Disk usage grows slightly over time
-        disk_percent = 45 + i * 0.01 + random.uniform(-1, 1)
-        
-        health_data.append({
-            "timestamp": timestamp.strftime("%Y-%m-%d %H:%M:%S"),
-            "cpu_percent": round(cpu_percent, 1),
-            "memory_percent": round(memory_percent, 1),
-            "disk_percent": round(disk_percent, 1),
-            "active_connections": int(10 + 15 * np.sin(np.pi * (time_of_day - 6) / 12) if 6 <= time_of_day <= 18 else 5)
-        })
+    st.markdown(preview_html, unsafe_allow_html=True)
+
+# Where the developer settings page persists its settings
+SETTINGS_FILE = os.path.join("data", "platform_settings.json")
+
+# Settings that are never written to disk or exported
+SECRET_SETTING_KEYS = frozenset({"smtp_password"})
+
+def without_secrets(values):
+    """Return a copy of a settings section with the SECRET_SETTING_KEYS left out."""
+    return {key: value for key, value in values.items() if key not in SECRET_SETTING_KEYS}
+
+def load_platform_settings():
+    """Return the saved platform settings keyed by section, or an empty dict if none are saved."""
+    try:
+        if os.path.getsize(SETTINGS_FILE) == 0:
+            return {}
+        
+        # Parse straight from a read-only mapping of the file
+        with open(SETTINGS_FILE, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if orjson is not None:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+            return json.loads(mm[:])
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"Error loading settings file {SETTINGS_FILE}: {str(e)}")
+        return {}
+
+def save_platform_settings(section, values):
+    """Save one section of the platform settings, keeping the other sections as they are.
     
-    # Sort by timestamp ascending for charting
-    health_data.sort(key=lambda x: x["timestamp"])
+    Secrets are dropped before saving. The file is written to a temporary file and then
+    swapped in, so readers never see it half-written.
+    """
+    settings = load_platform_settings()
+    settings[section] = without_secrets(values)
     
-    return health_data
+    settings_dir = os.path.dirname(SETTINGS_FILE)
+    os.makedirs(settings_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=settings_dir, prefix=".platform_settings-", suffix=".json")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(dump_json_bytes(settings))
+        os.replace(tmp_path, SETTINGS_FILE)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+# Options offered by the developer settings page
+DATABASE_TYPES = ("sqlite", "mysql", "postgresql")
+BACKUP_SCHEDULES = ("hourly", "daily", "weekly", "monthly")
+THEMES = ("light", "dark", "auto")
+FONT_FAMILIES = (
+    "Arial, sans-serif",
+    "Helvetica, sans-serif",
+    "Georgia, serif",
+    "Verdana, sans-serif",
+    "Courier New, monospace"
+)
 
 def render_developer_settings_page():
     """Render the developer settings page with system configuration options."""
@@ -5023,6 +5301,9 @@ def render_developer_settings_page():
             st.session_state.page = "developer_home"
             st.rerun()
     
+    # Previously saved settings override the defaults below
+    saved_settings = load_platform_settings()
+    
     # Settings tabs
     settings_tabs = st.tabs(["General Settings", "Authentication", "Email", "Database", "Appearance"])
     
@@ -5041,6 +5322,7 @@ def render_developer_settings_page():
             "enable_user_registration": True,
             "maintenance_mode": False
         }
+        general_settings.update(saved_settings.get("general", {}))
         
         # Create a form for general settings
         with st.form("general_settings_form"):
@@ -5091,7 +5373,7 @@ def render_developer_settings_page():
                 general_settings["enable_user_registration"] = enable_registration
                 general_settings["maintenance_mode"] = maintenance_mode
                 
-                # In a real application, this would save to a configuration file or database
+                save_platform_settings("general", general_settings)
                 st.success("General settings saved successfully!")
     
     # Authentication Tab
@@ -5109,6 +5391,7 @@ def render_developer_settings_page():
             "lockout_duration_minutes": 15,
             "remember_me_duration_days": 7
         }
+        auth_settings.update(saved_settings.get("authentication", {}))
         
         # Create a form for auth settings
         with st.form("auth_settings_form"):
@@ -5162,7 +5445,7 @@ def render_developer_settings_page():
                 auth_settings["max_login_attempts"] = max_attempts
                 auth_settings["lockout_duration_minutes"] = lockout_duration
                 
-                # In a real application, this would save to a configuration file or database
+                save_platform_settings("authentication", auth_settings)
                 st.success("Authentication settings saved successfully!")
     
     # Email Tab
@@ -5180,6 +5463,8 @@ def render_developer_settings_page():
             "enable_ssl": True,
             "enable_email_notifications": True
         }
+        # Settings saved by older versions may still hold the SMTP password; never send it back
+        email_settings.update(without_secrets(saved_settings.get("email", {})))
         
         # Create a form for email settings
         with st.form("email_settings_form"):
@@ -5230,7 +5515,7 @@ def render_developer_settings_page():
                 email_settings["enable_ssl"] = enable_ssl
                 email_settings["enable_email_notifications"] = enable_notifications
                 
-                # In a real application, this would save to a configuration file or database
+                save_platform_settings("email", email_settings)
                 st.success("Email settings saved successfully!")
             
             if test_button:
@@ -5253,13 +5538,14 @@ def render_developer_settings_page():
             "connection_timeout_seconds": 30,
             "max_connections": 100
         }
+        db_settings.update(saved_settings.get("database", {}))
         
         # Create a form for database settings
         with st.form("db_settings_form"):
             # Database type
             db_type = st.selectbox("Database Type", 
-                                  ["sqlite", "mysql", "postgresql"], 
-                                  index=["sqlite", "mysql", "postgresql"].index(db_settings["database_type"]))
+                                  DATABASE_TYPES, 
+                                  index=DATABASE_TYPES.index(db_settings["database_type"]))
             
             # Database path/connection
             if db_type == "sqlite":
@@ -5278,8 +5564,8 @@ def render_developer_settings_page():
             st.markdown("### Backup Settings")
             
             backup_schedule = st.selectbox("Backup Schedule", 
-                                         ["hourly", "daily", "weekly", "monthly"], 
-                                         index=["hourly", "daily", "weekly", "monthly"].index(db_settings["backup_schedule"]))
+                                         BACKUP_SCHEDULES, 
+                                         index=BACKUP_SCHEDULES.index(db_settings["backup_schedule"]))
             
             backup_retention = st.number_input("Backup Retention (days)", 
                                              min_value=1, 
@@ -5316,7 +5602,7 @@ def render_developer_settings_page():
                 db_settings["connection_timeout_seconds"] = conn_timeout
                 db_settings["max_connections"] = max_conns
                 
-                # In a real application, this would save to a configuration file or database
+                save_platform_settings("database", db_settings)
                 st.success("Database settings saved successfully!")
         
         # Separate buttons for database actions
@@ -5324,29 +5610,13 @@ def render_developer_settings_page():
         
         with db_action_col1:
             if st.button("Backup Database Now", use_container_width=True):
-                # In a real application, this would trigger a database backup
-                st.success("Database backup initiated!")
-                
-                # Show progress
-                progress_bar = st.progress(0)
-                for i in range(1, 101):
-                    # Simulate backup progress
-                    progress_bar.progress(i)
-                    if i == 100:
-                        st.success(f"Database backup completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}!")
+                # In a real application, this would run the backup inside an st.spinner
+                st.success(f"Database backup completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}!")
         
         with db_action_col2:
             if st.button("Optimize Database", use_container_width=True):
-                # In a real application, this would optimize the database
-                st.info("Database optimization in progress...")
-                
-                # Simulate optimization
-                progress_bar = st.progress(0)
-                for i in range(1, 101):
-                    # Simulate optimization progress
-                    progress_bar.progress(i)
-                    if i == 100:
-                        st.success("Database optimization completed!")
+                # In a real application, this would run the optimization inside an st.spinner
+                st.success("Database optimization completed!")
         
         with db_action_col3:
             if st.button("Test Connection", use_container_width=True):
@@ -5368,13 +5638,14 @@ def render_developer_settings_page():
             "theme": "light",
             "sidebar_collapse": False
         }
+        appearance_settings.update(saved_settings.get("appearance", {}))
         
         # Create a form for appearance settings
         with st.form("appearance_settings_form"):
             # Theme selection
             theme = st.selectbox("Theme", 
-                               ["light", "dark", "auto"], 
-                               index=["light", "dark", "auto"].index(appearance_settings["theme"]))
+                               THEMES, 
+                               index=THEMES.index(appearance_settings["theme"]))
             
             # Color settings
             st.markdown("### Color Settings")
@@ -5387,11 +5658,7 @@ def render_developer_settings_page():
             st.markdown("### Font Settings")
             
             font_family = st.selectbox("Font Family", 
-                                     ["Arial, sans-serif", 
-                                      "Helvetica, sans-serif", 
-                                      "Georgia, serif", 
-                                      "Verdana, sans-serif", 
-                                      "Courier New, monospace"], 
+                                     FONT_FAMILIES, 
                                      index=0)
             
             # Logo and favicon
@@ -5417,22 +5684,11 @@ def render_developer_settings_page():
                 appearance_settings["theme"] = theme
                 appearance_settings["sidebar_collapse"] = sidebar_collapse
                 
-                # In a real application, this would save to a configuration file or database
+                save_platform_settings("appearance", appearance_settings)
                 st.success("Appearance settings saved successfully!")
         
         # Preview
-        st.markdown("### Theme Preview")
-        
-        preview_html = f"""
-        <div style="padding: 20px; background-color: {secondary_color}; border-radius: 10px; margin-bottom: 20px;">
-            <h3 style="color: {primary_color};">Sample Heading</h3>
-            <p style="font-family: {font_family}; color: #333;">This is a sample paragraph showing how your selected theme will look.</p>
-            <button style="background-color: {primary_color}; color: white; border: none; padding: 10px 20px; border-radius: 5px; cursor: pointer;">Sample Button</button>
-            <a href="#" style="color: {accent_color}; margin-left: 10px; text-decoration: none;">Sample Link</a>
-        </div>
-        """
-        
-        st.markdown(preview_html, unsafe_allow_html=True)
+        _render_theme_preview(primary_color, secondary_color, accent_color, font_family)
     
     # Export and Import Settings
     st.markdown("### Export/Import Settings")
@@ -5445,14 +5701,14 @@ def render_developer_settings_page():
             all_settings = {
                 "general": general_settings,
                 "authentication": auth_settings,
-                "email": email_settings,
+                "email": without_secrets(email_settings),
                 "database": db_settings,
                 "appearance": appearance_settings,
                 "exported_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             }
             
-            # Convert to JSON
-            settings_json = json.dumps(all_settings, indent=2)
+            # Convert to JSON (bytes, which the download button accepts as is)
+            settings_json = dump_json_bytes(all_settings)
             
             # Offer download
             st.download_button(
@@ -5467,8 +5723,9 @@ def render_developer_settings_page():
         
         if uploaded_file is not None:
             try:
-                # Read and parse the uploaded JSON
-                imported_settings = json.load(uploaded_file)
+                # Parse the uploaded JSON straight from the upload's buffer without copying it
+                with uploaded_file.getbuffer() as settings_buffer:
+                    imported_settings = load_json_bytes(settings_buffer)
                 
                 # Display confirmation
                 st.success("Settings file uploaded successfully! Click 'Apply Imported Settings' to apply.")
@@ -5486,21 +5743,75 @@ def render_developer_settings_page():
     if st.button("Restart Platform", use_container_width=True):
         # In a real application, this would restart the platform
         st.warning("The platform will now restart. This may take a few moments.")
-        
-        # Show progress
-        progress_bar = st.progress(0)
-        for i in range(1, 101):
-            # Simulate restart progress
-            import time
-            time.sleep(0.02)  # Small delay to simulate processing
-            progress_bar.progress(i)
-            if i == 100:
-                st.success("Platform restarted successfully!")
+        st.success("Platform restarted successfully!")
+
+@st.cache_resource(show_spinner=False)
+def get_db():
+    """Shared Database instance.
+    
+    Creating a Database re-runs its schema setup, so one instance is reused across reruns
+    and sessions. Its methods open a connection per call, which keeps sharing it thread-safe.
+    """
+    from services.database import Database
+    return Database()
+
+# User types that can be assigned on the users page
+USER_TYPES = ("student", "professor", "developer")
+
+# User table columns, in display order, and their headings
+USER_COLUMNS = ["id", "name", "email", "student_id", "department", "user_type", "created_at"]
+USER_COLUMN_LABELS = ["ID", "Name", "Email", "Student/Employee ID", "Department", "User Type", "Created At"]
+
+# User fields matched by the users page search box
+USER_SEARCH_COLUMNS = ["name", "email", "student_id", "department"]
+
+@st.cache_data(ttl=30, max_entries=4, show_spinner=False)
+def _load_users():
+    """Fetch all users, cached briefly; cleared after user changes.
+    
+    Returns the user records and the same users as a DataFrame with USER_COLUMNS. Both
+    come from one cache entry, so the table and the record lookups always agree.
+    """
+    all_users = get_db().get_all_users()
+    return all_users, pd.DataFrame(all_users, columns=USER_COLUMNS)
+
+def user_stats(users_df):
+    """Total user count and a (count, share) pair per user type, taken from the users frame."""
+    total_users = len(users_df)
+    counts = users_df["user_type"].value_counts()
+    return total_users, {
+        user_type: (
+            int(counts.get(user_type, 0)),
+            f"{counts.get(user_type, 0)/total_users*100:.1f}%" if total_users > 0 else "0%"
+        )
+        for user_type in USER_TYPES
+    }
+
+def clear_user_caches():
+    """Drop the cached user data after users are added or removed."""
+    _load_users.clear()
+
+def filter_users(users_df, user_type, search_query):
+    """Filter the users frame by user type and a case-insensitive search across USER_SEARCH_COLUMNS."""
+    if users_df.empty:
+        return users_df
+    
+    mask = np.ones(len(users_df), dtype=bool)
+    if user_type != "All":
+        mask &= users_df["user_type"].eq(user_type).to_numpy()
+    
+    if search_query:
+        search_term = search_query.lower()
+        matches = np.zeros(len(users_df), dtype=bool)
+        for column in USER_SEARCH_COLUMNS:
+            matches |= users_df[column].str.lower().str.contains(search_term, regex=False, na=False).to_numpy()
+        mask &= matches
+    
+    return users_df[mask].reset_index(drop=True)
 
 def render_developer_users_page():
     """Render the developer users management page with real user data and full CRUD operations."""
     import pandas as pd
-    from services.database import Database
     
     st.markdown("""
     <div style="text-align: center; margin-bottom: 20px;">
@@ -5534,28 +5845,40 @@ def render_developer_users_page():
     if "search_query" not in st.session_state:
         st.session_state.search_query = ""
     
-    # Get all users from database
+    # Get all users from database (served from cache between user changes)
     try:
-        db = Database()
-        all_users = db.get_all_users()
+        db = get_db()
+        all_users, users_df = _load_users()
     except Exception as e:
         st.error(f"Error loading users: {str(e)}")
+        db = None
         all_users = []
+        users_df = pd.DataFrame(columns=USER_COLUMNS)
+    
+    # Statistics come from the same frame as the table, so the two never disagree
+    total_users, user_type_stats = user_stats(users_df)
     
     # Main control panel
-    col1, col2, col3 = st.columns([2, 2, 1])
-    with col1:
-        # User type filter
-        user_type_filter = st.selectbox(
-            "Filter by User Type",
-            ["All", "student", "professor", "developer"],
-            key="user_type_filter"
-        )
+    filter_col, col3 = st.columns([4, 1])
+    with filter_col:
+        # Filters are batched in a form so typing a search doesn't rerun the page per keystroke
+        with st.form("user_filter_form", border=False):
+            col1, col2 = st.columns(2)
+            with col1:
+                # User type filter
+                user_type_filter = st.selectbox(
+                    "Filter by User Type",
+                    ("All",) + USER_TYPES,
+                    key="user_type_filter"
+                )
+            
+            with col2:
+                # Search box
+                search_query = st.text_input("Search Users", key="user_search")
+            
+            st.form_submit_button("Apply Filters")
+        
         st.session_state.user_filter = user_type_filter
-    
-    with col2:
-        # Search box
-        search_query = st.text_input("Search Users", key="user_search")
         st.session_state.search_query = search_query
     
     with col3:
@@ -5565,263 +5888,271 @@ def render_developer_users_page():
             st.session_state.edit_user = None
     
     # Filter users based on selected criteria
-    filtered_users = all_users
-    if st.session_state.user_filter != "All":
-        filtered_users = [u for u in filtered_users if u["user_type"] == st.session_state.user_filter]
-    
-    if st.session_state.search_query:
-        search_term = st.session_state.search_query.lower()
-        filtered_users = [
-            u for u in filtered_users if 
-            search_term in u["name"].lower() or 
-            search_term in u["email"].lower() or 
-            search_term in u["student_id"].lower() or
-            search_term in u["department"].lower()
-        ]
+    filtered_df = filter_users(users_df, st.session_state.user_filter, st.session_state.search_query)
     
     # User statistics
     st.markdown("### User Statistics")
     stats_col1, stats_col2, stats_col3, stats_col4 = st.columns(4)
     
+    # Counts and shares come precomputed from the cached user statistics
     with stats_col1:
-        total_users = len(all_users)
         st.metric("Total Users", total_users)
     
     with stats_col2:
-        student_count = sum(1 for u in all_users if u["user_type"] == "student")
-        st.metric("Students", student_count, f"{student_count/total_users*100:.1f}%" if total_users > 0 else "0%")
+        st.metric("Students", *user_type_stats["student"])
     
     with stats_col3:
-        professor_count = sum(1 for u in all_users if u["user_type"] == "professor")
-        st.metric("Professors", professor_count, f"{professor_count/total_users*100:.1f}%" if total_users > 0 else "0%")
+        st.metric("Professors", *user_type_stats["professor"])
     
     with stats_col4:
-        developer_count = sum(1 for u in all_users if u["user_type"] == "developer")
-        st.metric("Developers", developer_count, f"{developer_count/total_users*100:.1f}%" if total_users > 0 else "0%")
+        st.metric("Developers", *user_type_stats["developer"])
     
     # User form for adding/editing users
-    if st.session_state.show_user_form:
-        st.markdown("### User Form")
-        
-        with st.form("user_form"):
-            # Determine if this is an edit or add operation
-            is_edit = st.session_state.edit_user is not None
-            edit_user = st.session_state.edit_user if is_edit else {}
-            
-            # Form fields
-            form_col1, form_col2 = st.columns(2)
-            
-            with form_col1:
-                name = st.text_input("Full Name", value=edit_user.get("name", ""))
-                email = st.text_input("Email", value=edit_user.get("email", ""))
-                student_id = st.text_input("Student/Employee ID", value=edit_user.get("student_id", ""))
-            
-            with form_col2:
-                department = st.text_input("Department", value=edit_user.get("department", ""))
-                user_type = st.selectbox(
-                    "User Type",
-                    ["student", "professor", "developer"],
-                    index=["student", "professor", "developer"].index(edit_user.get("user_type", "student")) if is_edit else 0
-                )
-                password = st.text_input("Password", type="password", value="" if not is_edit else "********")
-            
-            # Submit buttons
-            submit_col1, submit_col2 = st.columns(2)
-            
-            with submit_col1:
-                submit_text = "Update User" if is_edit else "Add User"
-                submit = st.form_submit_button(submit_text, use_container_width=True)
-            
-            with submit_col2:
-                cancel = st.form_submit_button("Cancel", use_container_width=True)
-            
-            if submit:
-                # Validate form data
-                if not name or not email or not student_id or not department:
-                    st.error("All fields are required.")
-                elif not is_edit and not password:
-                    st.error("Password is required for new users.")
-                else:
-                    try:
-                        # Create user data dictionary
-                        user_data = {
-                            "name": name,
-                            "email": email,
-                            "student_id": student_id,
-                            "department": department,
-                            "user_type": user_type
-                        }
-                        
-                        if not is_edit:
-                            # For new users, add password
-                            user_data["password"] = password
-                            # Register new user
-                            db.register_user(user_data)
-                            st.success(f"User {name} added successfully!")
-                        else:
-                            # For existing users, implement update logic
-                            # Note: This requires adding an update_user method to the Database class
-                            # Update user if password was changed
-                            if password and password != "********":
-                                user_data["password"] = password
-                                
-                            # Update user by ID
-                            user_id = edit_user.get("id")
-                            
-                            # Add implementation for update_user in Database class
-                            # For now, we'll show a message about this limitation
-                            st.info(f"Update for user {name} would be applied here. Updates not fully implemented yet.")
-                        
-                        # Reset form state
-                        st.session_state.show_user_form = False
-                        st.session_state.edit_user = None
-                        st.rerun()
-                    except Exception as e:
-                        st.error(f"Error saving user: {str(e)}")
-            
-            if cancel:
-                st.session_state.show_user_form = False
-                st.session_state.edit_user = None
-                st.rerun()
+    _render_user_form(db)
     
     # User deletion confirmation
-    if st.session_state.show_delete_confirm:
-        st.warning("⚠️ Are you sure you want to delete this user? This action cannot be undone.")
-        
-        confirm_col1, confirm_col2 = st.columns(2)
-        
-        with confirm_col1:
-            if st.button("Yes, Delete User", use_container_width=True):
-                try:
-                    # Delete user by ID
-                    user_id = st.session_state.delete_user_id
-                    deleted = db.delete_user(user_id)
-                    
-                    if deleted:
-                        st.success("User deleted successfully!")
-                    else:
-                        st.error("Failed to delete user.")
-                    
-                    # Reset state
-                    st.session_state.show_delete_confirm = False
-                    st.session_state.delete_user_id = None
-                    st.rerun()
-                except Exception as e:
-                    st.error(f"Error deleting user: {str(e)}")
-        
-        with confirm_col2:
-            if st.button("Cancel", use_container_width=True):
-                st.session_state.show_delete_confirm = False
-                st.session_state.delete_user_id = None
-                st.rerun()
+    _render_delete_confirm(db)
     
     # User table
     st.markdown("### User Accounts")
-    if filtered_users:
-        user_df = pd.DataFrame(filtered_users)
-        
-        # Reorder columns for better display
-        columns = ["id", "name", "email", "student_id", "department", "user_type", "created_at"]
-        user_df = user_df.reindex(columns=columns)
-        
-        # Rename columns for better display
-        display_columns = {
-            "id": "ID",
-            "name": "Name",
-            "email": "Email",
-            "student_id": "Student/Employee ID",
-            "department": "Department",
-            "user_type": "User Type",
-            "created_at": "Created At"
-        }
-        user_df = user_df.rename(columns=display_columns)
-        
-        # Add action buttons
-        action_buttons = []
-        for i, user in enumerate(filtered_users):
-            edit_button = f'<button onclick="editUser{i}()">Edit</button>'
-            delete_button = f'<button onclick="deleteUser{i}()">Delete</button>'
-            action_buttons.append(f"{edit_button} {delete_button}")
-        
-        # Define custom action column HTML
-        def create_action_buttons(idx):
-            col1, col2 = st.columns(2)
-            with col1:
-                if st.button("✏️ Edit", key=f"edit_user_{idx}", use_container_width=True):
-                    st.session_state.edit_user = filtered_users[idx]
-                    st.session_state.show_user_form = True
-                    st.rerun()
-            with col2:
-                if st.button("🗑️ Delete", key=f"delete_user_{idx}", use_container_width=True):
-                    st.session_state.delete_user_id = filtered_users[idx]["id"]
-                    st.session_state.show_delete_confirm = True
-                    st.rerun()
-        
-        # Display user table
-        st.dataframe(user_df, use_container_width=True)
+    if not filtered_df.empty:
+        # Relabel the columns for display on a shallow copy, so no data is copied
+        user_df = filtered_df.copy(deep=False)
+        user_df.columns = USER_COLUMN_LABELS
+        
+        # Display user table; selecting a row picks the user for the Edit/Delete buttons,
+        # so only one pair of action buttons is rendered however many users are listed.
+        # The key follows the filters so a selection never outlives the rows it points at
+        user_table = st.dataframe(
+            user_df,
+            use_container_width=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            key=f"user_table_{st.session_state.user_filter}_{st.session_state.search_query}"
+        )
+        selected_rows = [i for i in user_table.selection.rows if i < len(filtered_df)]
         
-        # Display action buttons for each row
-        for i in range(len(filtered_users)):
-            cols = st.columns([3, 3, 3, 1, 1])
-            with cols[3]:
-                if st.button("✏️ Edit", key=f"edit_{i}", use_container_width=True):
-                    st.session_state.edit_user = filtered_users[i]
+        if selected_rows:
+            # Look the selected user up by id in the original user records
+            users_by_id = {u["id"]: u for u in all_users}
+            selected_user_id = int(filtered_df.at[selected_rows[0], "id"])
+            
+            action_col1, action_col2, action_col3 = st.columns([1, 1, 4])
+            with action_col1:
+                if st.button("✏️ Edit", key="edit_selected_user", use_container_width=True):
+                    st.session_state.edit_user = users_by_id[selected_user_id]
                     st.session_state.show_user_form = True
                     st.rerun()
-            with cols[4]:
-                if st.button("🗑️ Delete", key=f"delete_{i}", use_container_width=True):
-                    st.session_state.delete_user_id = filtered_users[i]["id"]
+            with action_col2:
+                if st.button("🗑️ Delete", key="delete_selected_user", use_container_width=True):
+                    st.session_state.delete_user_id = selected_user_id
                     st.session_state.show_delete_confirm = True
                     st.rerun()
+        else:
+            st.caption("Select a user in the table to edit or delete them.")
     else:
         st.info("No users found matching the selected criteria.")
     
     # User permissions section
-    st.markdown("### User Permissions")
+    _render_user_permissions()
+
+@st.fragment
+def _render_user_form(db):
+    """Add/edit user form, rendered as a fragment so closing it only reruns the form."""
+    if not st.session_state.show_user_form:
+        return
     
-    permission_types = {
-        "student": [
-            "Take assigned quizzes",
-            "Create practice quizzes",
-            "View personal performance",
-            "View class rankings"
-        ],
-        "professor": [
-            "Create and manage quizzes",
-            "View student performance",
-            "Generate reports",
-            "Create coding assignments"
-        ],
-        "developer": [
-            "Full system access",
-            "User management",
-            "Database administration",
-            "System configuration"
-        ]
-    }
+    st.markdown("### User Form")
     
-    # Display permissions by user type
-    permission_tabs = st.tabs(["Student Permissions", "Professor Permissions", "Developer Permissions"])
+    with st.form("user_form"):
+        # Determine if this is an edit or add operation
+        is_edit = st.session_state.edit_user is not None
+        edit_user = st.session_state.edit_user if is_edit else {}
+        
+        # Form fields
+        form_col1, form_col2 = st.columns(2)
+        
+        with form_col1:
+            name = st.text_input("Full Name", value=edit_user.get("name", ""))
+            email = st.text_input("Email", value=edit_user.get("email", ""))
+            student_id = st.text_input("Student/Employee ID", value=edit_user.get("student_id", ""))
+        
+        with form_col2:
+            department = st.text_input("Department", value=edit_user.get("department", ""))
+            user_type = st.selectbox(
+                "User Type",
+                USER_TYPES,
+                index=USER_TYPES.index(edit_user.get("user_type", "student")) if is_edit else 0
+            )
+            password = st.text_input("Password", type="password", value="" if not is_edit else "********")
+        
+        # Submit buttons
+        submit_col1, submit_col2 = st.columns(2)
+        
+        with submit_col1:
+            submit_text = "Update User" if is_edit else "Add User"
+            submit = st.form_submit_button(submit_text, use_container_width=True)
+        
+        with submit_col2:
+            cancel = st.form_submit_button("Cancel", use_container_width=True)
+        
+        if submit:
+            # Validate form data
+            if not name or not email or not student_id or not department:
+                st.error("All fields are required.")
+            elif not is_edit and not password:
+                st.error("Password is required for new users.")
+            else:
+                try:
+                    # Create user data dictionary
+                    user_data = {
+                        "name": name,
+                        "email": email,
+                        "student_id": student_id,
+                        "department": department,
+                        "user_type": user_type
+                    }
+                    
+                    if not is_edit:
+                        # For new users, add password
+                        user_data["password"] = password
+                        # Register new user
+                        db.register_user(user_data)
+                        clear_user_caches()
+                        st.success(f"User {name} added successfully!")
+                    else:
+                        # For existing users, implement update logic
+                        # Note: This requires adding an update_user method to the Database class
+                        # Update user if password was changed
+                        if password and password != "********":
+                            user_data["password"] = password
+                            
+                        # Update user by ID
+                        user_id = edit_user.get("id")
+                        
+                        # Add implementation for update_user in Database class
+                        # For now, we'll show a message about this limitation
+                        st.info(f"Update for user {name} would be applied here. Updates not fully implemented yet.")
+                    
+                    # Reset form state. A new user changes the table and statistics, so the
+                    # whole page reruns; otherwise only this fragment needs to close the form
+                    st.session_state.show_user_form = False
+                    st.session_state.edit_user = None
+                    st.rerun(scope="fragment" if is_edit else "app")
+                except Exception as e:
+                    st.error(f"Error saving user: {str(e)}")
+        
+        if cancel:
+            st.session_state.show_user_form = False
+            st.session_state.edit_user = None
+            st.rerun(scope="fragment")
+
+@st.fragment
+def _render_delete_confirm(db):
+    """User deletion confirmation, rendered as a fragment so cancelling only reruns it."""
+    if not st.session_state.show_delete_confirm:
+        return
+    
+    st.warning("⚠️ Are you sure you want to delete this user? This action cannot be undone.")
+    
+    confirm_col1, confirm_col2 = st.columns(2)
+    
+    with confirm_col1:
+        if st.button("Yes, Delete User", use_container_width=True):
+            try:
+                # Delete user by ID
+                user_id = st.session_state.delete_user_id
+                deleted = db.delete_user(user_id)
+                clear_user_caches()
+                
+                if deleted:
+                    st.success("User deleted successfully!")
+                else:
+                    st.error("Failed to delete user.")
+                
+                # Reset state and rerun the whole page so the table drops the user
+                st.session_state.show_delete_confirm = False
+                st.session_state.delete_user_id = None
+                st.rerun()
+            except Exception as e:
+                st.error(f"Error deleting user: {str(e)}")
     
-    with permission_tabs[0]:
-        st.subheader("Student Access Level")
-        for perm in permission_types["student"]:
-            st.checkbox(perm, value=True, disabled=True)
+    with confirm_col2:
+        if st.button("Cancel", use_container_width=True):
+            st.session_state.show_delete_confirm = False
+            st.session_state.delete_user_id = None
+            st.rerun(scope="fragment")
+
+# Permissions granted to each user type, shown on the users page
+USER_PERMISSIONS = {
+    "student": [
+        "Take assigned quizzes",
+        "Create practice quizzes",
+        "View personal performance",
+        "View class rankings"
+    ],
+    "professor": [
+        "Create and manage quizzes",
+        "View student performance",
+        "Generate reports",
+        "Create coding assignments"
+    ],
+    "developer": [
+        "Full system access",
+        "User management",
+        "Database administration",
+        "System configuration"
+    ]
+}
+
+@st.fragment
+def _render_user_permissions():
+    """Static user permissions overview, rendered as a fragment with one markdown block per tab."""
+    st.markdown("### User Permissions")
     
-    with permission_tabs[1]:
-        st.subheader("Professor Access Level")
-        for perm in permission_types["professor"]:
-            st.checkbox(perm, value=True, disabled=True)
+    # Display permissions by user type
+    permission_tabs = st.tabs(["Student Permissions", "Professor Permissions", "Developer Permissions"])
     
-    with permission_tabs[2]:
-        st.subheader("Developer Access Level")
-        for perm in permission_types["developer"]:
-            st.checkbox(perm, value=True, disabled=True)
+    for tab, user_type in zip(permission_tabs, USER_PERMISSIONS):
+        with tab:
+            st.subheader(f"{user_type.capitalize()} Access Level")
+            st.markdown("  \n".join(f"✅ {perm}" for perm in USER_PERMISSIONS[user_type]))
 
 def render_profile_page():
     """Placeholder for profile page."""
     st.markdown("Profile page content would go here.")
 
+def format_time_remaining(time_remaining):
+    """Format a timedelta as whole days left, or whole hours when less than a day is left."""
+    days = time_remaining.days
+    if days > 0:
+        return f"{days} day{'s' if days != 1 else ''}"
+    hours = time_remaining.seconds // 3600
+    return f"{hours} hour{'s' if hours != 1 else ''}"
+
+def format_due_date(end_time):
+    """Format a due date, adding the time of day unless it is midnight."""
+    if end_time.hour or end_time.minute:
+        return f"{end_time:%Y-%m-%d %H:%M}"
+    return f"{end_time:%Y-%m-%d}"
+
+# Due-date styles for under 1 day, under 3 days and 3+ days left
+DUE_URGENCY_STYLES = ("color:red;font-weight:bold", "color:orange;font-weight:bold", "color:green")
+
+# Number of quiz cards rendered at a time on the assigned quizzes page
+QUIZ_CARDS_PER_PAGE = 10
+
+# Quiz fields shown on an assigned quiz card, with the default used when one is missing
+QUIZ_CARD_FIELDS = (
+    ("id", None),
+    ("title", "Untitled Quiz"),
+    ("description", "No description provided"),
+    ("course", "N/A"),
+    ("duration_minutes", 60),
+    ("end_time", "Not set"),
+    ("created_date", None)
+)
+
 def render_assigned_quizzes_page():
     """Render the assigned quizzes page for students."""
     st.markdown("""
@@ -5851,42 +6182,38 @@ def render_assigned_quizzes_page():
     # Use the datetime module imported at the top of the file
     current_time = datetime.now()
     
-    # Use the global parse_date_with_formats function defined at the top of the file
+    # Due dates are parsed with the cached parse_due_date, so each distinct end_time
+    # string is parsed once no matter how often the filter, sort and cards ask for it
     
     # Only show quizzes that haven't passed their due date
     active_quizzes = []
     for quiz in professor_quizzes:
-        # Check if the quiz has an end_time/due date
+        # If hide_after_due_date is set to False, the quiz is always shown and its
+        # due date doesn't need parsing. If it is True (default), only show if not expired
+        if not quiz.get('hide_after_due_date', True):
+            active_quizzes.append(quiz)
+            continue
+        
+        # If there's no end_time specified, keep the quiz visible
         end_time_str = quiz.get('end_time')
-        if end_time_str:
-            # Parse the end_time string to a datetime object
-            end_time = parse_date_with_formats(end_time_str)
-            
-            if end_time:
-                # If the hide_after_due_date is set to False, show all quizzes
-                # If hide_after_due_date is True (default), only show if not expired
-                hide_after_due = quiz.get('hide_after_due_date', True)
-                
-                if not hide_after_due or current_time < end_time:
-                    active_quizzes.append(quiz)
-            else:
-                # If we can't parse the end_time, we'll keep the quiz visible
-                active_quizzes.append(quiz)
-        else:
-            # If there's no end_time specified, keep the quiz visible
+        if not end_time_str:
+            active_quizzes.append(quiz)
+            continue
+        
+        # If we can't parse the end_time, we'll keep the quiz visible
+        end_time = parse_due_date(end_time_str)
+        if end_time is None or current_time < end_time:
             active_quizzes.append(quiz)
     
     # Replace the professor_quizzes with filtered active_quizzes
     professor_quizzes = active_quizzes
     
-    # Use the global parse_date_with_formats function with appropriate default
-    
     # Sort the quizzes by due date (closest due date first), then by creation timestamp
     professor_quizzes = sorted(
         professor_quizzes,
         key=lambda q: (
             # First sort key: due date (if available)
-            parse_date_with_formats(q.get('end_time'), datetime.max),
+            parse_due_date(q.get('end_time')) or datetime.max,
             
             # Second sort key: creation timestamp (newest first, so use negative value)
             -(q.get('creation_timestamp', 0) if q.get('creation_timestamp') else 
@@ -5920,7 +6247,21 @@ def render_assigned_quizzes_page():
         # Add a status bar explaining the features
         st.info("Found " + str(len(professor_quizzes)) + " quizzes. Click on 'Start Quiz' to begin a quiz.")
         
-        for i, quiz in enumerate(professor_quizzes):
+        # Only the first cards are rendered; "Load more" adds another page of them
+        visible_count = st.session_state.get("assigned_quizzes_visible", QUIZ_CARDS_PER_PAGE)
+        
+        # Index completed quizzes by quiz id once (keeping the first entry per quiz,
+        # as a linear search would) so each card's lookup is a single dict access
+        completed_by_id = {
+            q.get("quiz_id"): q for q in reversed(st.session_state.get("completed_quizzes", []))
+        }
+        
+        for i, quiz in enumerate(professor_quizzes[:visible_count]):
+            # Read the fields the card shows once, with their display defaults
+            quiz_id, title, description, course, duration, end_time_str, created_date = (
+                quiz.get(key, default) for key, default in QUIZ_CARD_FIELDS
+            )
+            
             with st.container():
                 st.markdown("---")
                 
@@ -5929,105 +6270,188 @@ def render_assigned_quizzes_page():
                 
                 with col1:
                     # Quiz title and description
-                    st.markdown(f"### {quiz.get('title', 'Untitled Quiz')}")
-                    st.markdown(f"_{quiz.get('description', 'No description provided')}_")
+                    st.markdown(f"### {title}")
+                    st.markdown(f"_{description}_")
                     
                     # Display quiz metadata in a clean row
                     metadata_cols = st.columns(3)
                     with metadata_cols[0]:
-                        st.markdown(f"**Course:** {quiz.get('course', 'N/A')}")
+                        st.markdown(f"**Course:** {course}")
                     with metadata_cols[1]:
-                        st.markdown(f"**Duration:** {quiz.get('duration_minutes', 60)} minutes")
+                        st.markdown(f"**Duration:** {duration} minutes")
                     with metadata_cols[2]:
                         # Show due date with time remaining
-                        end_time_str = quiz.get('end_time', 'Not set')
-                        
                         if end_time_str != 'Not set':
-                            # Use the same helper function to parse date reliably
-                            end_time = parse_date_with_formats(end_time_str)
+                            # Use the same cached helper to parse date reliably
+                            end_time = parse_due_date(end_time_str)
                             
                             if end_time:
                                 time_remaining = end_time - datetime.now()
-                                
-                                # Format time remaining
                                 days_remaining = time_remaining.days
-                                hours_remaining = time_remaining.seconds // 3600
-                                
-                                if days_remaining > 0:
-                                    time_text = f"{days_remaining} day{'s' if days_remaining != 1 else ''}"
-                                else:
-                                    time_text = f"{hours_remaining} hour{'s' if hours_remaining != 1 else ''}"
-                                
-                                # Format the displayed date string
-                                formatted_date = end_time.strftime('%Y-%m-%d')
-                                if end_time.hour != 0 or end_time.minute != 0:
-                                    formatted_date += end_time.strftime(' %H:%M')
+                                time_text = format_time_remaining(time_remaining)
+                                formatted_date = format_due_date(end_time)
                                 
                                 # Different colors based on urgency
-                                if days_remaining < 1:
-                                    st.markdown(f"**Due:** {formatted_date} <span style='color:red;font-weight:bold'>({time_text} left)</span>", unsafe_allow_html=True)
-                                elif days_remaining < 3:
-                                    st.markdown(f"**Due:** {formatted_date} <span style='color:orange;font-weight:bold'>({time_text} left)</span>", unsafe_allow_html=True)
-                                else:
-                                    st.markdown(f"**Due:** {formatted_date} <span style='color:green'>({time_text} left)</span>", unsafe_allow_html=True)
+                                urgency_style = DUE_URGENCY_STYLES[(days_remaining >= 1) + (days_remaining >= 3)]
+                                st.markdown(f"**Due:** {formatted_date} <span style='{urgency_style}'>({time_text} left)</span>", unsafe_allow_html=True)
                             else:
                                 st.markdown(f"**Due:** {end_time_str}")
                         else:
                             st.markdown(f"**Due:** {end_time_str}")
                     
                     # Add creation date if available
-                    if quiz.get('created_date'):
-                        st.caption(f"Published: {quiz.get('created_date')}")
+                    if created_date:
+                        st.caption(f"Published: {created_date}")
                 
                 with col2:
                     # Check if the student has already completed this quiz
-                    has_completed = False
-                    if "completed_quizzes" in st.session_state:
-                        has_completed = any(q.get("quiz_id") == quiz.get('id') for q in st.session_state.completed_quizzes)
+                    completed_entry = completed_by_id.get(quiz_id)
                         
-                    if has_completed:
+                    if completed_entry is not None:
                         # Show completed status and score
-                        score = next((q.get("score", 0) for q in st.session_state.completed_quizzes 
-                                     if q.get("quiz_id") == quiz.get('id')), 0)
+                        score = completed_entry.get("score", 0)
                         st.success(f"Completed - Score: {score:.1f}%")
                         
                         # Add View Results button
-                        if st.button("View Results", key=f"view_results_{quiz.get('id')}", use_container_width=True):
-                            st.session_state.current_quiz_id = quiz.get('id')
+                        if st.button("View Results", key=f"view_results_{quiz_id}", use_container_width=True):
+                            st.session_state.current_quiz_id = quiz_id
                             st.session_state.page = "student_results"
                             st.rerun()
                     else:
                         # Start quiz button
-                        if st.button("Start Quiz", key=f"start_quiz_{quiz.get('id')}", use_container_width=True, type="primary"):
-                            st.session_state.current_quiz_id = quiz.get('id')
+                        if st.button("Start Quiz", key=f"start_quiz_{quiz_id}", use_container_width=True, type="primary"):
+                            st.session_state.current_quiz_id = quiz_id
                             
                             # Get questions from the quiz
                             if "questions" in quiz:
                                 st.session_state.questions = quiz["questions"]
                             else:
-                                # If somehow the quiz doesn't have questions, look in available_quizzes
-                                for q in st.session_state.available_quizzes:
-                                    if q.get("id") == quiz.get('id') and "questions" in q:
-                                        st.session_state.questions = q["questions"]
-                                        break
+                                # If somehow the quiz doesn't have questions, look in available_quizzes.
+                                # Searched only on click, so reruns don't pay for an index
+                                fallback_quiz = next(
+                                    (q for q in available_quizzes if q.get("id") == quiz_id and "questions" in q),
+                                    None
+                                )
+                                if fallback_quiz is not None:
+                                    st.session_state.questions = fallback_quiz["questions"]
                             
                             if "quiz_answers" not in st.session_state:
                                 st.session_state.quiz_answers = {}
                             
                             st.session_state.page = "student_quiz"
                             st.rerun()
+        
+        if len(professor_quizzes) > visible_count:
+            st.markdown("---")
+            st.button(
+                f"Load more quizzes ({len(professor_quizzes) - visible_count} more)",
+                key="load_more_assigned_quizzes",
+                on_click=lambda: st.session_state.update(assigned_quizzes_visible=visible_count + QUIZ_CARDS_PER_PAGE),
+                use_container_width=True
+            )
+
+
+# Database reads for the rankings page, cached per student and quiz and cleared when a
+# quiz is submitted. Failed reads raise and are not cached, so the page's sample-data
+# fallbacks still apply. Database does not provide these queries yet, so for now the
+# page always falls back to the sample data
+@st.cache_data(ttl=600, show_spinner=False)
+def _load_completed_quizzes(student_id):
+    """Fetch a student's completed quizzes."""
+    return get_db().get_student_completed_quizzes(student_id)
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _load_quiz_details(student_id, quiz_id):
+    """Fetch a student's detailed results for one quiz."""
+    return get_db().get_student_quiz_details(student_id, quiz_id)
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _load_class_rankings(quiz_id):
+    """Fetch the class rankings for one quiz."""
+    return get_db().get_class_rankings(quiz_id)
+
+def clear_ranking_caches():
+    """Drop the cached rankings page reads after a quiz is submitted."""
+    _load_completed_quizzes.clear()
+    _load_quiz_details.clear()
+    _load_class_rankings.clear()
+
+def _sample_completed_quizzes():
+    """Sample completed quizzes shown when there are no real results to display.
+    
+    Not cached: the list is cheap to build and the submission times are relative to now.
+    """
+    return [
+        {
+            "id": "quiz1",
+            "title": "Python Basics Quiz",
+            "course": "Introduction to Programming",
+            "score": 85,
+            "rank": 3,
+            "total_students": 15,
+            "submission_time": (datetime.now() - timedelta(days=5)).strftime("%Y-%m-%d %H:%M:%S"),
+            "visible_to_students": True
+        },
+        {
+            "id": "quiz2",
+            "title": "Data Structures in Python",
+            "course": "Intermediate Python",
+            "score": 92,
+            "rank": 1,
+            "total_students": 12,
+            "submission_time": (datetime.now() - timedelta(days=2)).strftime("%Y-%m-%d %H:%M:%S"),
+            "visible_to_students": True
+        },
+        {
+            "id": "quiz3",
+            "title": "Object-Oriented Programming",
+            "course": "Advanced Python",
+            "score": 78,
+            "rank": 5,
+            "total_students": 10,
+            "submission_time": (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S"),
+            "visible_to_students": True
+        }
+    ]
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _sample_class_rankings(quiz_id):
+    """Sample class rankings for a quiz, sorted by score; quiz_id only serves as the cache key.
+    
+    Cached in memory so a quiz's sample rankings don't reshuffle on every rerun.
+    """
+    # Generate random student data
+    student_names = ["John S.", "Emma J.", "Michael B.", "Sophia D.", 
+                    "William W.", "Olivia M.", "James A.", "Ava T.", 
+                    "Benjamin T.", "Isabella W.", "Lucas H.", "Mia M.", 
+                    "Henry T.", "Charlotte G.", "Alexander R."]
+    
+    class_rankings = []
+    for i, name in enumerate(student_names):
+        # Generate random score between 50 and 100
+        score = random.randint(50, 100)
+        
+        # Mark the current student
+        is_current = (i == 2)  # For demonstration, assume the 3rd student is the current one
+        
+        class_rankings.append({
+            "rank": i + 1,
+            "student_name": name,
+            "score": score,
+            "is_current_student": is_current
+        })
+    
+    # Sort by score (itemgetter keeps the key lookup in C), then renumber the ranks
+    class_rankings.sort(key=operator.itemgetter("score"), reverse=True)
+    for rank, ranking in enumerate(class_rankings, 1):
+        ranking["rank"] = rank
+    
+    return class_rankings
+
+
 def render_student_rankings_page():
     """Render the rankings and results page for students."""
-    st.markdown("""
-    <div style="text-align: center; margin-bottom: 30px;">
-        <h1 style="color: #003B70; font-size: 2.5rem; font-weight: 800; margin-bottom: 10px;">
-            My Rankings & Results
-        </h1>
-        <p style="color: #4B5563; font-size: 1.2rem; margin-bottom: 0;">
-            View your performance and rankings in completed quizzes
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(RANKINGS_HEADER_HTML, unsafe_allow_html=True)
     
     # Back button
     if st.button("← Back to Dashboard", key="back_to_student_dashboard_rankings"):
@@ -6038,19 +6462,11 @@ def render_student_rankings_page():
     current_student_id = st.session_state.get("user_id", "current_student")
     
     # Quiz selection section
-    st.markdown("""
-    <div style="background-color: white; border-radius: 10px; padding: 25px; 
-    box-shadow: 0 4px 15px rgba(0, 59, 112, 0.1); margin-bottom: 20px; border: 1px solid rgba(0, 59, 112, 0.1);">
-        <h3 style="color: #003B70; font-weight: 700; margin-bottom: 20px; font-size: 1.5rem;">My Completed Quizzes</h3>
-    """, unsafe_allow_html=True)
+    st.markdown(COMPLETED_QUIZZES_CARD_HTML, unsafe_allow_html=True)
     
     try:
-        # Get data from database
-        from services.database import Database
-        db = Database()
-        
-        # Get all student's completed quizzes
-        completed_quizzes = db.get_student_completed_quizzes(current_student_id)
+        # Get all student's completed quizzes from the database
+        completed_quizzes = _load_completed_quizzes(current_student_id)
         
     except Exception as e:
         # First try to get from session state
@@ -6058,18 +6474,18 @@ def render_student_rankings_page():
             # Convert session state completed quizzes to expected format
             completed_quizzes = []
             
+            # Index available quizzes by id once, keeping the first entry per id
+            available_by_id = {
+                q.get("id"): q for q in reversed(st.session_state.get("available_quizzes", []))
+            }
+            
             for completed in st.session_state.completed_quizzes:
                 quiz_id = completed.get("quiz_id")
                 score = completed.get("score", 0)
                 submission_time = completed.get("submission_time", "Unknown")
                 
                 # Find the quiz info from available_quizzes
-                quiz_info = None
-                if "available_quizzes" in st.session_state:
-                    for q in st.session_state.available_quizzes:
-                        if q.get("id") == quiz_id:
-                            quiz_info = q
-                            break
+                quiz_info = available_by_id.get(quiz_id)
                 
                 if quiz_info:
                     quiz_data = {
@@ -6087,43 +6503,8 @@ def render_student_rankings_page():
             # Fall back to sample data
             st.warning(f"Using sample data for demonstration. No completed quizzes found.")
             
-            # Sample quiz data for demonstration
-            import random
-            from datetime import datetime, timedelta
-            
-            # Generate sample completed quizzes
-            completed_quizzes = [
-                {
-                    "id": "quiz1",
-                    "title": "Python Basics Quiz",
-                    "course": "Introduction to Programming",
-                    "score": 85,
-                    "rank": 3,
-                    "total_students": 15,
-                    "submission_time": (datetime.now() - timedelta(days=5)).strftime("%Y-%m-%d %H:%M:%S"),
-                    "visible_to_students": True
-                },
-                {
-                    "id": "quiz2",
-                    "title": "Data Structures in Python",
-                    "course": "Intermediate Python",
-                    "score": 92,
-                    "rank": 1,
-                    "total_students": 12,
-                    "submission_time": (datetime.now() - timedelta(days=2)).strftime("%Y-%m-%d %H:%M:%S"),
-                    "visible_to_students": True
-                },
-                {
-                    "id": "quiz3",
-                    "title": "Object-Oriented Programming",
-                    "course": "Advanced Python",
-                    "score": 78,
-                    "rank": 5,
-                    "total_students": 10,
-                    "submission_time": (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S"),
-                    "visible_to_students": True
-                }
-            ]
+            # Sample completed quizzes, dated relative to now
+            completed_quizzes = _sample_completed_quizzes()
     
     # Filter only quizzes that are visible to students (professor made them visible)
     visible_quizzes = [q for q in completed_quizzes if q.get("visible_to_students", False)]
@@ -6133,6 +6514,107 @@ def render_student_rankings_page():
         st.markdown("</div>", unsafe_allow_html=True)
         return
     
+    # Quiz selection, results and rankings
+    _render_quiz_results(visible_quizzes, current_student_id)
+
+# Static markup for the rankings page
+RANKINGS_HEADER_HTML = """
+<div style="text-align: center; margin-bottom: 30px;">
+    <h1 style="color: #003B70; font-size: 2.5rem; font-weight: 800; margin-bottom: 10px;">
+        My Rankings & Results
+    </h1>
+    <p style="color: #4B5563; font-size: 1.2rem; margin-bottom: 0;">
+        View your performance and rankings in completed quizzes
+    </p>
+</div>
+"""
+
+RANKINGS_CARD_TEMPLATE = """
+<div style="background-color: white; border-radius: 10px; padding: 25px; 
+box-shadow: 0 4px 15px rgba(0, 59, 112, 0.1); margin-bottom: 20px; border: 1px solid rgba(0, 59, 112, 0.1);">
+    <h3 style="color: #003B70; font-weight: 700; margin-bottom: 20px; font-size: 1.5rem;">{title}</h3>
+"""
+COMPLETED_QUIZZES_CARD_HTML = RANKINGS_CARD_TEMPLATE.format(title="My Completed Quizzes")
+MY_RESULTS_CARD_HTML = RANKINGS_CARD_TEMPLATE.format(title="My Results")
+CLASS_RANKINGS_CARD_HTML = RANKINGS_CARD_TEMPLATE.format(title="Class Rankings")
+
+# Rank summary shown next to the score card
+RANK_CARD_TEMPLATE = """
+<div style="text-align: center; padding: 20px;">
+    <div style="font-size: 3rem; font-weight: bold; color: #003B70;">
+        {rank} <span style="font-size: 1.5rem;">/ {total}</span>
+    </div>
+    <h3 style="color: #003B70; margin-top: 10px;">Your Rank</h3>
+    <p style="color: #666;">Top {percentile:.1f}% of class</p>
+</div>
+"""
+
+# Circular score card on the rankings page, filled in with the score and its color
+SCORE_CARD_TEMPLATE = """
+<div style="text-align: center; padding: 20px;">
+    <div style="position: relative; width: 150px; height: 150px; margin: 0 auto;">
+        <svg viewBox="0 0 36 36" style="width: 100%; height: 100%;">
+            <path d="M18 2.0845
+                a 15.9155 15.9155 0 0 1 0 31.831
+                a 15.9155 15.9155 0 0 1 0 -31.831"
+                fill="none" stroke="#eee" stroke-width="3" />
+            <path d="M18 2.0845
+                a 15.9155 15.9155 0 0 1 0 31.831
+                a 15.9155 15.9155 0 0 1 0 -31.831"
+                fill="none" stroke="{color}" stroke-width="3" stroke-dasharray="{score}, 100" />
+            <text x="18" y="20.5" font-family="Arial" font-size="10" text-anchor="middle" fill="{color}" font-weight="bold">
+                {score}%
+            </text>
+        </svg>
+    </div>
+</div>
+"""
+
+# Colors for low, passing and high scores, shared by the score card and rankings chart
+SCORE_COLOR_SCALE = ("#F44336", "#FFC107", "#4CAF50")
+
+def score_color(score):
+    """Pick the SCORE_COLOR_SCALE color for a score: below 60, 60-79, or 80 and up."""
+    return SCORE_COLOR_SCALE[(score >= 60) + (score >= 80)]
+
+# Layout of the class rankings chart
+RANKING_CHART_LAYOUT = {"height": 400, "margin": {"t": 50, "b": 50, "l": 50, "r": 50}}
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _build_ranking_figure(students, scores, is_current):
+    """Build the top-students bar chart as a Plotly figure dict, marking the current student's bar."""
+    chart_data = pd.DataFrame({"Student": students, "Score": scores})
+    
+    # Create the bar chart with highlighting for current student
+    fig = px.bar(
+        chart_data,
+        x="Student",
+        y="Score",
+        title="Top 10 Student Rankings",
+        labels={"Student": "", "Score": "Score (%)"},
+        color="Score",
+        color_continuous_scale=SCORE_COLOR_SCALE,
+        range_color=[50, 100]
+    )
+    
+    # Highlight the current student's bar
+    for i, current in enumerate(is_current):
+        if current:
+            fig.add_shape(
+                type="rect",
+                x0=i-0.4, x1=i+0.4,
+                y0=0, y1=scores[i],
+                line=dict(width=2, color="#003B70"),
+                fillcolor="rgba(0, 59, 112, 0.2)"
+            )
+    
+    fig.update_layout(**RANKING_CHART_LAYOUT)
+    
+    return fig.to_dict()
+
+@st.fragment
+def _render_quiz_results(visible_quizzes, student_id):
+    """Selected quiz results and class rankings; a fragment, so picking another quiz only reruns this part."""
     # Format options for the selectbox
     quiz_options = {q['id']: f"{q.get('title', 'Untitled Quiz')} ({q.get('course', 'N/A')})" for q in visible_quizzes}
     
@@ -6152,11 +6634,7 @@ def render_student_rankings_page():
         return
     
     # Personal Results section
-    st.markdown("""
-    <div style="background-color: white; border-radius: 10px; padding: 25px; 
-    box-shadow: 0 4px 15px rgba(0, 59, 112, 0.1); margin-bottom: 20px; border: 1px solid rgba(0, 59, 112, 0.1);">
-        <h3 style="color: #003B70; font-weight: 700; margin-bottom: 20px; font-size: 1.5rem;">My Results</h3>
-    """, unsafe_allow_html=True)
+    st.markdown(MY_RESULTS_CARD_HTML, unsafe_allow_html=True)
     
     # Display personal results in a visually appealing way
     col1, col2 = st.columns(2)
@@ -6164,43 +6642,17 @@ def render_student_rankings_page():
     with col1:
         # Score card with circular progress indicator
         score = selected_quiz.get("score", 0)
-        color = "#4CAF50" if score >= 80 else "#FFC107" if score >= 60 else "#F44336"
+        color = score_color(score)
         
-        st.markdown(f"""
-        <div style="text-align: center; padding: 20px;">
-            <div style="position: relative; width: 150px; height: 150px; margin: 0 auto;">
-                <svg viewBox="0 0 36 36" style="width: 100%; height: 100%;">
-                    <path d="M18 2.0845
-                        a 15.9155 15.9155 0 0 1 0 31.831
-                        a 15.9155 15.9155 0 0 1 0 -31.831"
-                        fill="none" stroke="#eee" stroke-width="3" />
-                    <path d="M18 2.0845
-                        a 15.9155 15.9155 0 0 1 0 31.831
-                        a 15.9155 15.9155 0 0 1 0 -31.831"
-                        fill="none" stroke="{color}" stroke-width="3" stroke-dasharray="{int(score)}, 100" />
-                    <text x="18" y="20.5" font-family="Arial" font-size="10" text-anchor="middle" fill="{color}" font-weight="bold">
-                        {int(score)}%
-                    </text>
-                </svg>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(SCORE_CARD_TEMPLATE.format(color=color, score=int(score)), unsafe_allow_html=True)
     
     with col2:
         # Ranking information
         rank = selected_quiz.get("rank", 0)
         total = selected_quiz.get("total_students", 0)
-        percentile = 100 - (rank / total * 100) if total > 0 else 0
+        percentile = 100 - rank * 100 / total if total > 0 else 0
         
-        st.markdown(f"""
-        <div style="text-align: center; padding: 20px;">
-            <div style="font-size: 3rem; font-weight: bold; color: #003B70;">
-                {rank} <span style="font-size: 1.5rem;">/ {total}</span>
-            </div>
-            <h3 style="color: #003B70; margin-top: 10px;">Your Rank</h3>
-            <p style="color: #666;">Top {percentile:.1f}% of class</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(RANK_CARD_TEMPLATE.format(rank=rank, total=total, percentile=percentile), unsafe_allow_html=True)
     
     # Add detailed results
     st.markdown("<hr style='margin: 20px 0;'>", unsafe_allow_html=True)
@@ -6209,7 +6661,7 @@ def render_student_rankings_page():
     # Sample detailed results
     try:
         # Get detailed results from database
-        quiz_details = db.get_student_quiz_details(current_student_id, selected_option)
+        quiz_details = _load_quiz_details(student_id, selected_option)
     except Exception:
         # Silently use sample data without showing error message
         
@@ -6224,16 +6676,14 @@ def render_student_rankings_page():
         }
     
     # Display detailed results
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric("Correct Answers", f"{quiz_details.get('correct_answers', 0)}/{quiz_details.get('total_questions', 0)}")
-    
-    with col2:
-        st.metric("Time Spent", f"{quiz_details.get('time_spent', 0)} min")
-    
-    with col3:
-        st.metric("Questions", quiz_details.get('total_questions', 0))
+    total_questions = quiz_details.get('total_questions', 0)
+    detail_metrics = (
+        ("Correct Answers", f"{quiz_details.get('correct_answers', 0)}/{total_questions}"),
+        ("Time Spent", f"{quiz_details.get('time_spent', 0)} min"),
+        ("Questions", total_questions)
+    )
+    for metric_col, (label, value) in zip(st.columns(3), detail_metrics):
+        metric_col.metric(label, value)
     
     # Strengths and areas for improvement
     st.markdown("<br>", unsafe_allow_html=True)
@@ -6242,20 +6692,12 @@ def render_student_rankings_page():
     with col1:
         st.markdown("<h5 style='color: #4CAF50;'>Strengths</h5>", unsafe_allow_html=True)
         strengths = quiz_details.get("strengths", [])
-        if strengths:
-            for strength in strengths:
-                st.markdown(f"✅ {strength}")
-        else:
-            st.markdown("No specific strengths identified.")
+        st.markdown("  \n".join(f"✅ {strength}" for strength in strengths) or "No specific strengths identified.")
     
     with col2:
         st.markdown("<h5 style='color: #FFC107;'>Areas for Improvement</h5>", unsafe_allow_html=True)
         improvements = quiz_details.get("areas_for_improvement", [])
-        if improvements:
-            for area in improvements:
-                st.markdown(f"⚠️ {area}")
-        else:
-            st.markdown("No specific areas for improvement identified.")
+        st.markdown("  \n".join(f"⚠️ {area}" for area in improvements) or "No specific areas for improvement identified.")
     
     # Professor feedback
     st.markdown("<br>", unsafe_allow_html=True)
@@ -6266,127 +6708,51 @@ def render_student_rankings_page():
     st.markdown("</div>", unsafe_allow_html=True)
     
     # Class Rankings section
-    st.markdown("""
-    <div style="background-color: white; border-radius: 10px; padding: 25px; 
-    box-shadow: 0 4px 15px rgba(0, 59, 112, 0.1); margin-bottom: 20px; border: 1px solid rgba(0, 59, 112, 0.1);">
-        <h3 style="color: #003B70; font-weight: 700; margin-bottom: 20px; font-size: 1.5rem;">Class Rankings</h3>
-    """, unsafe_allow_html=True)
+    st.markdown(CLASS_RANKINGS_CARD_HTML, unsafe_allow_html=True)
     
-    try:
-        # Get class rankings from database
-        class_rankings = db.get_class_rankings(selected_option)
-    except Exception:
-        # Sample class rankings for demonstration without showing error message
-        import random
-        
-        # Generate random student data
-        student_names = ["John S.", "Emma J.", "Michael B.", "Sophia D.", 
-                        "William W.", "Olivia M.", "James A.", "Ava T.", 
-                        "Benjamin T.", "Isabella W.", "Lucas H.", "Mia M.", 
-                        "Henry T.", "Charlotte G.", "Alexander R."]
-        
-        class_rankings = []
-        for i, name in enumerate(student_names):
-            # Generate random score between 50 and 100
-            score = random.randint(50, 100)
+    # Streamlit runs an expander's body even while it is collapsed, so the rankings
+    # table and chart are only built once the student switches them on
+    if st.toggle("Show class rankings", key="show_class_rankings"):
+        try:
+            # Get class rankings from database
+            class_rankings = _load_class_rankings(selected_option)
+        except Exception:
+            # Sample class rankings for demonstration without showing error message,
+            # cached in memory per quiz so they stay the same across reruns
+            class_rankings = _sample_class_rankings(selected_option)
+        
+        # Build the table straight from the ranking records, keeping scores numeric
+        ranking_df = pd.DataFrame(
+            class_rankings,
+            columns=["rank", "student_name", "score", "is_current_student"]
+        ).fillna({"student_name": "Anonymous", "score": 0, "is_current_student": False})
+        ranking_df.columns = ["Rank", "Student", "Score", "is_current"]
+        
+        # Create table
+        if not ranking_df.empty:
+            # Show the table with native column types instead of a server-side styled
+            # table; the current student is marked with a star column
+            display_df = ranking_df.drop(columns=["is_current"])
+            display_df.insert(0, "", np.where(ranking_df["is_current"].to_numpy(dtype=bool), "⭐", ""))
+            st.dataframe(
+                display_df,
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    "Rank": st.column_config.NumberColumn(width="small"),
+                    "Score": st.column_config.ProgressColumn(min_value=0, max_value=100, format="%d%%")
+                }
+            )
             
-            # Mark the current student
-            is_current = (i == 2)  # For demonstration, assume the 3rd student is the current one
+            # Create a bar chart for the top 10 scores; the figure is cached per set of rankings
+            chart_data = ranking_df.head(10)
+            fig = _build_ranking_figure(
+                tuple(chart_data["Student"]),
+                tuple(chart_data["Score"].tolist()),
+                tuple(chart_data["is_current"].tolist())
+            )
             
-            class_rankings.append({
-                "rank": i + 1,
-                "student_name": name,
-                "score": score,
-                "is_current_student": is_current
-            })
-        
-        # Sort by score
-        class_rankings.sort(key=lambda x: x.get("score", 0), reverse=True)
-        
-        # Update ranks after sorting
-        for i, ranking in enumerate(class_rankings):
-            ranking["rank"] = i + 1
-    
-    # Create a DataFrame for display
-    import pandas as pd
-    
-    # Extract relevant data
-    ranking_data = []
-    for ranking in class_rankings:
-        ranking_data.append({
-            "Rank": ranking.get("rank", "-"),
-            "Student": ranking.get("student_name", "Anonymous"),
-            "Score": f"{ranking.get('score', 0)}%",
-            "is_current": ranking.get("is_current_student", False)
-        })
-    
-    # Create table
-    if ranking_data:
-        ranking_df = pd.DataFrame(ranking_data)
-        
-        # Apply styling to highlight current student and top performers
-        def highlight_rows(row):
-            if row.get("is_current"):
-                return ['background-color: #e8f4f8; font-weight: bold'] * (len(row) - 1)  # -1 to exclude the is_current column
-            elif row["Rank"] <= 3:  # Top 3 rows
-                return ['background-color: #f8f9fa'] * (len(row) - 1)
-            return [''] * (len(row) - 1)
-        
-        # Create a styled dataframe without the is_current column for display
-        display_df = ranking_df.drop(columns=["is_current"])
-        
-        # Apply the styling
-        styled_df = display_df.style.apply(
-            lambda row: highlight_rows({**row, "is_current": ranking_df.loc[row.name, "is_current"]}), 
-            axis=1
-        )
-        
-        # Display the styled dataframe
-        st.dataframe(
-            styled_df,
-            use_container_width=True,
-            hide_index=True
-        )
-        
-        # Create a bar chart for visualization
-        import plotly.express as px
-        
-        # Extract top 10 scores for chart
-        chart_data = pd.DataFrame({
-            "Student": [s["Student"] for s in ranking_data[:10]],  # Top 10 only
-            "Score": [float(s["Score"].replace("%", "")) for s in ranking_data[:10]],
-            "is_current": [s["is_current"] for s in ranking_data[:10]]
-        })
-        
-        # Create the bar chart with highlighting for current student
-        fig = px.bar(
-            chart_data,
-            x="Student",
-            y="Score",
-            title="Top 10 Student Rankings",
-            labels={"Student": "", "Score": "Score (%)"},
-            color="Score",
-            color_continuous_scale=["#F44336", "#FFC107", "#4CAF50"],
-            range_color=[50, 100]
-        )
-        
-        # Highlight the current student's bar
-        for i, is_current in enumerate(chart_data["is_current"]):
-            if is_current:
-                fig.add_shape(
-                    type="rect",
-                    x0=i-0.4, x1=i+0.4,
-                    y0=0, y1=chart_data["Score"].iloc[i],
-                    line=dict(width=2, color="#003B70"),
-                    fillcolor="rgba(0, 59, 112, 0.2)"
-                )
-        
-        fig.update_layout(
-            height=400,
-            margin=dict(t=50, b=50, l=50, r=50)
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True)
     
     st.markdown("</div>", unsafe_allow_html=True)
 